@@ -1,101 +1,144 @@
 """
 Example usage of the refactored Bloch sphere visualization.
+
+Images are written at a preview resolution of 100 DPI by default; pass
+``--dpi 300`` (or set ``QSIP_DPI=300``) for publication-quality output.
 """
 
-import numpy as np
+import argparse
 import os
-from qsip.visualization.bloch import Bloch, QuantumState, pauli_x, pauli_y, pauli_z
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib
+import numpy as np
+from qsip.gates import PAULIS  # (3, 2, 2) stack of X, Y, Z
+from qsip.visualization.bloch import Bloch, QuantumState
 
-# Create output directory
+# Common scalar and state constants
+_INV_SQRT2 = 1.0 / np.sqrt(2.0)
+_KET_PLUS = np.array([1, 1], dtype=complex) * _INV_SQRT2  # |+⟩
+
+# Output directory (created when the script runs, not on import)
 output_dir = "bloch_outputs"
-if not os.path.exists(output_dir):
-    os.makedirs(output_dir)
+
+# Preview resolution; override with QSIP_DPI or --dpi
+DEFAULT_DPI = 100
+
+
+# Fast zlib level for PNG output; files are slightly larger but encode much faster
+_PNG_OPTIONS = {'compress_level': 1}
+
+
+def _dpi():
+    """Resolution for saved examples, read at save time so workers see it."""
+    return int(os.environ.get("QSIP_DPI", DEFAULT_DPI))
+
+
+def _prepare(b=None):
+    """Return a fresh Bloch sphere, reusing ``b`` when one is given."""
+    if b is None:
+        return Bloch()
+    b.clear()
+    b.show_axis_labels = True
+    return b
+
+
+def _save(b, filename, shared):
+    """Save ``b`` to the output directory.
+    
+    A shared sphere keeps its figure open, so the next example draws on the
+    same Figure and axes instead of building new ones.
+    """
+    b.save(name=os.path.join(output_dir, filename), dpin=_dpi(),
+           pil_kwargs=_PNG_OPTIONS, close=not shared)
+    print(f"Saved: {output_dir}/{filename}")
+
 
 # Example 1: Create and plot a simple qubit state
-def example_basic():
+def example_basic(b=None):
     """Basic example with a single qubit state."""
+    shared = b is not None
     # Create a Bloch sphere
-    b = Bloch()
+    b = _prepare(b)
     
     # Create a quantum state |+⟩ = (|0⟩ + |1⟩)/√2
-    plus_state = QuantumState(state_vector=np.array([1, 1])/np.sqrt(2))
+    plus_state = QuantumState(state_vector=_KET_PLUS)
     
     # Add the state as a vector
     b.add_states(plus_state, kind='vector')
     
     # Save the Bloch sphere
-    b.save(name=os.path.join(output_dir, 'example_basic.png'), dpin=300)
-    print(f"Saved: {output_dir}/example_basic.png")
+    _save(b, 'example_basic.png', shared)
 
 
 # Example 2: Multiple states with custom colors
-def example_multiple_states():
+def example_multiple_states(b=None):
     """Example with multiple quantum states."""
-    b = Bloch()
-    
-    # Create several quantum states
-    states = [
-        QuantumState(state_vector=np.array([1, 0])),  # |0⟩
-        QuantumState(state_vector=np.array([0, 1])),  # |1⟩
-        QuantumState(state_vector=np.array([1, 1])/np.sqrt(2)),  # |+⟩
-        QuantumState(state_vector=np.array([1, -1])/np.sqrt(2)),  # |−⟩
-        QuantumState(state_vector=np.array([1, 1j])/np.sqrt(2)),  # |i⟩
-        QuantumState(state_vector=np.array([1, -1j])/np.sqrt(2)),  # |−i⟩
-    ]
+    shared = b is not None
+    b = _prepare(b)
+    
+    # Bloch vectors of the six cardinal states, known in closed form
+    bloch_vecs = np.array([
+        [0, 0, 1],   # |0⟩
+        [0, 0, -1],  # |1⟩
+        [1, 0, 0],   # |+⟩
+        [-1, 0, 0],  # |−⟩
+        [0, 1, 0],   # |i⟩
+        [0, -1, 0],  # |−i⟩
+    ], dtype=float)
     
     # Hide axis labels since we have custom annotations
     b.show_axis_labels = False
     
-    # Add states with default Morandi colors (automatically cycles through palette)
-    for state in states:
-        b.add_states(state, kind='vector', alpha=0.9)
+    # Add all vectors at once with default Morandi colors (cycles through palette)
+    b.add_vectors(bloch_vecs, alpha=0.9)
     
     # Add labels using smart positioning with Unicode ket notation
-    b.add_annotation_smart([0, 0, 1], r'$|0⟩$', offset=0.25, fontsize=14)
-    b.add_annotation_smart([0, 0, -1], r'$|1⟩$', offset=0.25, fontsize=14)
-    b.add_annotation_smart([1, 0, 0], r'$|+⟩$', offset=0.25, fontsize=14)
-    b.add_annotation_smart([-1, 0, 0], r'$|-⟩$', offset=0.25, fontsize=14)
-    b.add_annotation_smart([0, 1, 0], r'$|+i⟩$', offset=0.25, fontsize=14)
-    b.add_annotation_smart([0, -1, 0], r'$|-i⟩$', offset=0.25, fontsize=14)
+    labels = [r'$|0⟩$', r'$|1⟩$', r'$|+⟩$', r'$|-⟩$', r'$|+i⟩$', r'$|-i⟩$']
+    b.add_annotations_smart(bloch_vecs, labels, offset=0.25, fontsize=14)
     
-    b.save(name=os.path.join(output_dir, 'example_multiple_states.png'), dpin=300)
-    print(f"Saved: {output_dir}/example_multiple_states.png")
+    _save(b, 'example_multiple_states.png', shared)
 
 
 # Example 3: Trajectory on the Bloch sphere
-def example_trajectory():
+def example_trajectory(b=None):
     """Example showing a trajectory on the Bloch sphere."""
-    b = Bloch()
-    
-    # Create a trajectory of states
-    t = np.linspace(0, 2*np.pi, 50)
-    points = []
-    
-    for theta in t:
-        # Rotate around the equator
-        state_vector = np.array([np.cos(theta/2), np.sin(theta/2) * np.exp(1j * 0)])
-        state = QuantumState(state_vector=state_vector)
-        vec = [state.expectation(pauli_x()), 
-               state.expectation(pauli_y()), 
-               state.expectation(pauli_z())]
-        points.append(vec)
+    shared = b is not None
+    b = _prepare(b)
+    
+    # Create a trajectory of states: 50 distinct angles over one period
+    # (t = 2π would just repeat the state at t = 0)
+    n = 50
+    t = np.linspace(0, 2*np.pi, n, endpoint=False)
+    
+    # Rotate around the equator: cos(t/2)|0⟩ + sin(t/2)|1⟩. The relative
+    # phase is zero, so the amplitudes are real and the Bloch vector has
+    # the closed form (2αβ, 0, α² - β²) -- no complex arithmetic needed.
+    alpha = np.cos(t/2)
+    beta = np.sin(t/2)
+    points = np.empty((3, n + 1))
+    np.multiply(2*alpha, beta, out=points[0, :n])
+    points[1] = 0.0
+    np.subtract(alpha*alpha, beta*beta, out=points[2, :n])
+    
+    # Close the loop by repeating the first point instead of recomputing it
+    points[:, n] = points[:, 0]
     
     # Add as connected points
-    points = np.array(points).T
     b.add_points(points, meth='l', colors='#95859C', alpha=0.8)  # Soft purple-grey
     
     # Add start and end points
     b.add_points(points[:, 0:1], meth='s', colors='#B08291')  # Dusty rose
     b.add_points(points[:, -1:], meth='s', colors='#6B9080')  # Forest sage
     
-    b.save(name=os.path.join(output_dir, 'example_trajectory.png'), dpin=300)
-    print(f"Saved: {output_dir}/example_trajectory.png")
+    _save(b, 'example_trajectory.png', shared)
 
 
 # Example 4: Mixed states
-def example_mixed_states():
+def example_mixed_states(b=None):
     """Example with mixed quantum states."""
-    b = Bloch()
+    shared = b is not None
+    b = _prepare(b)
     
     # Pure state at the north pole
     pure_state = QuantumState(state_vector=np.array([1, 0]))
@@ -105,36 +148,72 @@ def example_mixed_states():
     mixed_state = QuantumState(density_matrix=np.eye(2)/2)
     b.add_states(mixed_state, kind='point', colors='#B08291')  # Dusty rose
     
-    # Partially mixed states
-    for p in [0.7, 0.5, 0.3]:
-        rho = p * np.outer([1, 0], [1, 0]) + (1-p) * np.eye(2)/2
-        partial_mixed = QuantumState(density_matrix=rho)
-        b.add_states(partial_mixed, kind='point', colors='#C89F83', alpha=0.8)  # Rich terracotta
+    # Partially mixed states rho = p|0⟩⟨0| + (1-p) I/2, built as one (3, 2, 2) stack
+    proj0 = np.array([[1, 0], [0, 0]], dtype=complex)
+    half_identity = np.eye(2, dtype=complex)/2
+    ps = np.array([0.7, 0.5, 0.3])
+    rhos = ps[:, None, None] * proj0 + (1-ps)[:, None, None] * half_identity
+    
+    # Bloch coordinates Tr(rho sigma_k) for every state at once; each state
+    # stays its own point set, so it keeps its own marker and size
+    bloch_vecs = np.einsum('nij,kji->nk', rhos, PAULIS).real
+    for v in bloch_vecs:
+        b.add_points(v, meth='s', colors='#C89F83', alpha=0.8)  # Rich terracotta
     
     b.add_annotation([0, 0, 0.1], r'$\rho = \frac{\mathbb{I}}{2}$', fontsize=12, 
                      bbox=dict(boxstyle='round,pad=0.3', facecolor='#FFFEF5', 
                               edgecolor='#8B7355', alpha=0.9))
     
-    b.save(name=os.path.join(output_dir, 'example_mixed_states.png'), dpin=300)
-    print(f"Saved: {output_dir}/example_mixed_states.png")
+    _save(b, 'example_mixed_states.png', shared)
+
+
+# All examples, in the order they are run
+EXAMPLES = [
+    ("Basic example", example_basic),
+    ("Multiple states", example_multiple_states),
+    ("Trajectory", example_trajectory),
+    ("Mixed states", example_mixed_states),
+]
+
+
+def _run_example(example):
+    """Run a single example on its own Bloch sphere (process pool worker)."""
+    example()
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render the Bloch sphere examples.")
+    parser.add_argument("--jobs", type=int, default=len(EXAMPLES),
+                        help="number of worker processes; 1 renders serially "
+                             "on one shared Bloch sphere")
+    parser.add_argument("--dpi", type=int, default=None,
+                        help=f"output resolution (default: $QSIP_DPI or {DEFAULT_DPI})")
+    args = parser.parse_args()
+    if args.dpi is not None:
+        os.environ["QSIP_DPI"] = str(args.dpi)
+    
+    os.makedirs(output_dir, exist_ok=True)
+    
     print("Running Bloch sphere examples...")
     print(f"Output directory: {output_dir}")
     print("-" * 40)
     
-    print("\n1. Basic example:")
-    example_basic()
-    
-    print("\n2. Multiple states:")
-    example_multiple_states()
-    
-    print("\n3. Trajectory:")
-    example_trajectory()
-    
-    print("\n4. Mixed states:")
-    example_mixed_states()
+    if args.jobs > 1:
+        # The examples share no state, so render them in parallel. Workers
+        # only write files, so keep them (and us) on the non-interactive
+        # Agg backend.
+        os.environ.setdefault("MPLBACKEND", "Agg")
+        matplotlib.use("Agg")
+        with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+            list(executor.map(_run_example, [f for _, f in EXAMPLES]))
+    else:
+        # One Bloch sphere shared by all examples, cleared between them
+        b = Bloch()
+        for i, (title, example) in enumerate(EXAMPLES, 1):
+            print(f"\n{i}. {title}:")
+            example(b)
+        import matplotlib.pyplot as plt
+        plt.close(b.fig)
     
     print("\n" + "-" * 40)
-    print(f"All examples saved to '{output_dir}/' directory")
\ No newline at end of file
+    print(f"All examples saved to '{output_dir}/' directory")
@@ -10,21 +10,25 @@ __email__ = "your.email@example.com"
 # Import key components for easy access
 from qsip.visualization.bloch import Bloch, QuantumState
 
-# Import translator (with graceful fallback if openqasm3 not installed)
-try:
-    from qsip.translators import print_tex, print_qtz
-    _TRANSLATOR_AVAILABLE = True
-except ImportError:
-    _TRANSLATOR_AVAILABLE = False
-    print_tex = None
-    print_qtz = None
-
 __all__ = [
     "Bloch",
-    "QuantumState", 
+    "QuantumState",
+    "print_tex",
+    "print_tex_many",
+    "print_tex_batch",
+    "print_qtz",
     "__version__",
 ]
 
-# Add translator functions to __all__ only if available
-if _TRANSLATOR_AVAILABLE:
-    __all__.extend(["print_tex", "print_qtz"])
\ No newline at end of file
+# Translator functions are resolved lazily (PEP 562) so that ``import qsip``
+# doesn't pay for loading the translator stack unless it is actually used.
+_LAZY_TRANSLATORS = ("print_tex", "print_tex_many", "print_tex_batch", "print_qtz")
+
+
+def __getattr__(name):
+    if name in _LAZY_TRANSLATORS:
+        from qsip import translators
+        value = getattr(translators, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
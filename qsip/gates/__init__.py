@@ -2,5 +2,20 @@
 Quantum gates and operations.
 """
 
-# Future imports will go here
-__all__ = []
\ No newline at end of file
+import numpy as np
+
+__all__ = ["I", "X", "Y", "Z", "PAULIS"]
+
+# Single-qubit Pauli matrices. They are shared, read-only arrays, so
+# callers never rebuild them; copy one before modifying it.
+I = np.eye(2, dtype=complex)
+X = np.array([[0, 1], [1, 0]], dtype=complex)
+Y = np.array([[0, -1j], [1j, 0]], dtype=complex)
+Z = np.array([[1, 0], [0, -1]], dtype=complex)
+
+# X, Y, Z stacked as a (3, 2, 2) tensor for batched expectation values
+PAULIS = np.stack([X, Y, Z])
+
+for _m in (I, X, Y, Z, PAULIS):
+    _m.flags.writeable = False
+del _m
@@ -23,43 +23,99 @@ Example:
     >>> print_tex(circuit, save_fig=True, options={"width": "3mm"})
 """
 
+import hashlib
+import importlib.util
 import os
+import re
 import tempfile
 import subprocess
 import sys
 import platform
-from typing import List, Dict, Optional, Union, Tuple, Any
+import threading
+from collections import defaultdict
+from functools import lru_cache, partial
+from types import MappingProxyType
+from typing import List, Dict, Optional, Union, Tuple, Any, Callable
 from dataclasses import dataclass, field
 
-# Setup PATH for LaTeX on macOS
-if platform.system() == 'Darwin':  # macOS
-    # Common LaTeX installation paths on macOS
-    latex_paths = [
-        '/Library/TeX/texbin',
-        '/usr/local/texlive/2025/bin/universal-darwin',
-        '/usr/local/texlive/2024/bin/universal-darwin',
-        '/usr/local/texlive/2023/bin/universal-darwin',
-    ]
+from .utils import _resolve_pdflatex
+
+# Whether _ensure_latex_path has already run
+_latex_path_ready = False
+
+
+def _ensure_latex_path():
+    """Add the common macOS LaTeX locations to PATH, once, before the first render.
     
-    # Add LaTeX paths to environment
-    current_path = os.environ.get('PATH', '')
-    for latex_path in latex_paths:
-        if os.path.exists(latex_path) and latex_path not in current_path:
-            os.environ['PATH'] = f"{latex_path}:{current_path}"
-            current_path = os.environ['PATH']
+    Kept out of import time so that importing the module does no
+    filesystem probing and leaves PATH alone for users who never compile.
+    """
+    global _latex_path_ready
+    if _latex_path_ready:
+        return
+    _latex_path_ready = True
+    
+    if platform.system() == 'Darwin':  # macOS
+        # Common LaTeX installation paths on macOS
+        latex_paths = [
+            '/Library/TeX/texbin',
+            '/usr/local/texlive/2025/bin/universal-darwin',
+            '/usr/local/texlive/2024/bin/universal-darwin',
+            '/usr/local/texlive/2023/bin/universal-darwin',
+        ]
+        
+        # Add LaTeX paths to environment
+        current_path = os.environ.get('PATH', '')
+        for latex_path in latex_paths:
+            if os.path.exists(latex_path) and latex_path not in current_path:
+                os.environ['PATH'] = f"{latex_path}:{current_path}"
+                current_path = os.environ['PATH']
 
-# Try importing openqasm3 - provide clear error if not installed
-try:
-    import openqasm3
-    from openqasm3 import ast
-    OPENQASM_AVAILABLE = True
-except ImportError:
-    OPENQASM_AVAILABLE = False
-    openqasm3 = None
-    ast = None
+
+# openqasm3 is only located here and imported on first use (see
+# _load_openqasm): importing it builds the ANTLR parser, which used to
+# dominate the import time of this module
+OPENQASM_AVAILABLE = importlib.util.find_spec("openqasm3") is not None
+openqasm3 = None
+ast = None
+
+# Plain wire cell, shared by every padded position
+_QW = "\\qw"
+
+# Fixed target cells
+_TARG = "\\targ{}"
+_TARGX = "\\targX{}"
+
+
+# \ctrl{d} cells by wire distance; distances are small and repeat a lot
+@lru_cache(maxsize=None)
+def _ctrl(distance: int) -> str:
+    """The ``\\ctrl{distance}`` cell, formatted once per distance."""
+    return f"\\ctrl{{{distance}}}"
+
+
+_METER = "\\meter{}"
+
+
+# \meter{} cells with a classical \wire, by signed row offset
+@lru_cache(maxsize=None)
+def _meter_wire(offset: int) -> str:
+    """A ``\\meter{}`` cell with a classical wire ``offset`` rows down (up if negative)."""
+    direction = 'd' if offset > 0 else 'u'
+    return f"{_METER}\\wire[{direction}][{abs(offset)}]{{c}}"
 
 
-@dataclass
+# Gate and parameter name groups tested on every gate
+_CNOT_NAMES = frozenset({'cx', 'cnot'})
+_CYZ_NAMES = frozenset({'cy', 'cz'})
+_TOFFOLI_NAMES = frozenset({'ccx', 'toffoli'})
+_GREEK_PARAMS = frozenset({'theta', 'phi', 'lambda', 'alpha', 'beta', 'gamma'})
+
+# Slotted dataclasses where supported (Python 3.10+)
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class QubitMapping:
     """Maps qubit identifiers to wire indices."""
     name: str
@@ -73,7 +129,7 @@ class QubitMapping:
         return self.start_index + offset
 
 
-@dataclass 
+@dataclass(**_DATACLASS_SLOTS)
 class CircuitLayout:
     """Manages the layout of quantum and classical registers."""
     qubit_registers: Dict[str, QubitMapping] = field(default_factory=dict)
@@ -86,6 +142,18 @@ class CircuitLayout:
         self.qubit_registers[name] = QubitMapping(name, size, self.total_qubits)
         self.total_qubits += size
     
+    def qubit_labels(self) -> List[Optional[str]]:
+        """Wire label for every qubit index, filled register by register."""
+        labels: List[Optional[str]] = [None] * self.total_qubits
+        for reg_name, reg_map in self.qubit_registers.items():
+            start = reg_map.start_index
+            if reg_map.size > 1:
+                for idx in range(reg_map.size):
+                    labels[start + idx] = f"{reg_name}[{idx}]"
+            elif reg_map.size == 1:
+                labels[start] = reg_name
+        return labels
+    
     def add_classical_register(self, name: str, size: int):
         """Add a classical register."""
         self.classical_registers[name] = {"size": size, "start": self.total_cbits}
@@ -93,15 +161,14 @@ class CircuitLayout:
     
     def get_qubit_index(self, qubit: Any) -> int:
         """Get the wire index for a qubit."""
+        reg = None
+        
         # Handle IndexedIdentifier (e.g., q[0])
-        if hasattr(qubit, '__class__') and qubit.__class__.__name__ == 'IndexedIdentifier':
-            # Get register name from qubit.name.name
-            reg_name = qubit.name.name
-                
-            if reg_name in self.qubit_registers:
-                # Extract index value from indices
+        if isinstance(qubit, ast.IndexedIdentifier):
+            reg = self.qubit_registers.get(qubit.name.name)
+            if reg is not None:
                 # indices is a list of lists (for multi-dimensional arrays)
-                if hasattr(qubit, 'indices') and qubit.indices:
+                if qubit.indices:
                     idx_expr = qubit.indices[0][0]  # First dimension, first index
                     
                     # Get numeric value
@@ -113,20 +180,17 @@ class CircuitLayout:
                         raise ValueError(f"Cannot extract index from {idx_expr}")
                 else:
                     idx = 0
-                    
-                return self.qubit_registers[reg_name].get_index(idx)
-                
+        
         # Handle simple Identifier (e.g., q for single qubit register)
-        elif hasattr(qubit, 'name') and hasattr(qubit.name, 'name'):
-            reg_name = qubit.name.name
-            if reg_name in self.qubit_registers:
-                return self.qubit_registers[reg_name].get_index(0)
-        elif hasattr(qubit, 'name') and isinstance(qubit.name, str):
-            reg_name = qubit.name
-            if reg_name in self.qubit_registers:
-                return self.qubit_registers[reg_name].get_index(0)
+        elif isinstance(qubit, ast.Identifier):
+            reg = self.qubit_registers.get(qubit.name)
+            idx = 0
         
-        raise ValueError(f"Unknown qubit: {qubit} (type: {type(qubit).__name__})")
+        if reg is None:
+            raise ValueError(f"Unknown qubit: {qubit} (type: {type(qubit).__name__})")
+        if idx >= reg.size:
+            raise ValueError(f"Qubit index {idx} out of range for register {reg.name}[{reg.size}]")
+        return reg.start_index + idx
 
 
 class QuantikzTranslator:
@@ -146,70 +210,76 @@ class QuantikzTranslator:
         circuit_rows (List[List[str]]): LaTeX commands for each qubit wire
         errors (List[str]): Collection of error messages
         warnings (List[str]): Collection of warning messages
-        measurement_map (Dict[str, List[Tuple[int, int]]]): Maps classical bits to measurements
-        pending_classical_ops (List[Tuple[str, Any]]): Stores classically controlled gates
+        pending_classical_ops (Dict[str, List[Any]]): Classically controlled gates by cbit
     """
     
+    __slots__ = (
+        'layout', 'circuit_rows', 'errors', 'warnings', 'next_column',
+        '_active_rows', 'pending_classical_ops', '_qubit_labels',
+    )
+    
+    # Standard gate mappings. Shared by every translator, so read-only:
+    # an edit on one instance would silently change all of them
+    standard_gates = MappingProxyType({
+        'h': 'H', 'x': 'X', 'y': 'Y', 'z': 'Z',
+        'cx': 'CNOT', 'cnot': 'CNOT', 'cy': 'CY', 'cz': 'CZ',
+        's': 'S', 'sdg': 'S^\\dagger', 't': 'T', 'tdg': 'T^\\dagger',
+        'sx': '\\sqrt{X}', 'sxdg': '\\sqrt{X}^\\dagger',
+        'swap': 'SWAP', 'ccx': 'Toffoli', 'toffoli': 'Toffoli'
+    })
+    
+    # Prebuilt LaTeX for the fixed gate cells, so hot paths append
+    # a cached string instead of formatting one per gate. Built once per
+    # class rather than per translator, like the gate table below.
+    _single_gate_tex = MappingProxyType({
+        name: f"\\gate{{{tex}}}" for name, tex in standard_gates.items()
+    })
+    _controlled_target_tex = MappingProxyType({'cy': "\\gate{Y}", 'cz': "\\gate{Z}"})
+    
     def __init__(self):
         self.layout = CircuitLayout()
         self.circuit_rows: List[List[str]] = []
-        self.classical_rows: List[List[str]] = []  # Track classical wire rows
         self.errors: List[str] = []
         self.warnings: List[str] = []
-        self.has_classical_control = False  # Flag to track if we need classical wires
-        self.measurement_map: Dict[str, List[Tuple[int, int]]] = {}  # Maps cbit name to (qubit_idx, column) where measured
-        self.current_column = 0  # Track current column position
-        self.pending_classical_ops: List[Tuple[str, Any]] = []  # Store (cbit_key, gate) pairs
-        
-        # Standard gate mappings
-        self.standard_gates = {
-            'h': 'H', 'x': 'X', 'y': 'Y', 'z': 'Z',
-            'cx': 'CNOT', 'cnot': 'CNOT', 'cy': 'CY', 'cz': 'CZ',
-            's': 'S', 'sdg': 'S^\\dagger', 't': 'T', 'tdg': 'T^\\dagger',
-            'sx': '\\sqrt{X}', 'sxdg': '\\sqrt{X}^\\dagger',
-            'swap': 'SWAP', 'ccx': 'Toffoli', 'toffoli': 'Toffoli'
-        }
+        self.next_column = 0  # Column the next operation is placed in
+        self._active_rows: List[int] = []  # Rows written in the current column
+        self._qubit_labels: List[Optional[str]] = []  # Wire label per qubit index
+        self.pending_classical_ops: Dict[str, List[Any]] = defaultdict(list)  # cbit_key -> gates
     
     def translate(self, qasm_ast: Any) -> str:
         """Translate OpenQASM3 AST to quantikz LaTeX."""
-        # Process declarations first
+        _load_openqasm()
+        
+        # Single walk over the statements: declarations are applied right
+        # away (the layout must be complete before anything is placed), the
+        # rest is bucketed by phase and replayed in order below. Branches are
+        # registered before any gate is placed so that measurements can pull
+        # in the gates they control.
+        branches = []
+        operations = []
         for statement in qasm_ast.statements:
-            if hasattr(statement, '__class__'):
-                stmt_type = statement.__class__.__name__
-                if stmt_type == 'QubitDeclaration':
-                    self._process_qubit_declaration(statement)
-                elif stmt_type == 'ClassicalDeclaration':
-                    self._process_classical_declaration(statement)
+            entry = _STATEMENT_HANDLERS.get(type(statement))
+            if entry is None:
+                continue
+            phase, handler = entry
+            if phase is _DECLARATION:
+                handler(self, statement)
+            elif phase is _BRANCHING:
+                branches.append((handler, statement))
+            else:
+                operations.append((handler, statement))
+        
+        # The layout is final once declarations are in
+        self._qubit_labels = self.layout.qubit_labels()
         
         # Initialize circuit rows
         self.circuit_rows = [[] for _ in range(self.layout.total_qubits)]
-        # Initialize classical rows if needed
-        if self.layout.total_cbits > 0:
-            self.classical_rows = [[] for _ in range(self.layout.total_cbits)]
         
-        # First pass: collect all if statements
-        for statement in qasm_ast.statements:
-            if hasattr(statement, '__class__'):
-                stmt_type = statement.__class__.__name__
-                if stmt_type == 'BranchingStatement':
-                    self._process_branching(statement)
-        
-        # Second pass: process gates and operations
-        for i, statement in enumerate(qasm_ast.statements):
-            if hasattr(statement, '__class__'):
-                stmt_type = statement.__class__.__name__
-                if stmt_type == 'QuantumGate':
-                    self._process_gate(statement)
-                elif stmt_type == 'QuantumMeasurement':
-                    self._process_measurement(statement)
-                elif stmt_type == 'QuantumMeasurementStatement':
-                    # Unwrap the measurement
-                    self._process_measurement(statement.measure, statement.target)
-                elif stmt_type == 'QuantumBarrier':
-                    self._process_barrier(statement)
-                elif stmt_type == 'QuantumReset':
-                    self._process_reset(statement)
-                # BranchingStatement already processed in first pass
+        # Register branches first, then place gates and operations
+        for handler, statement in branches:
+            handler(self, statement)
+        for handler, statement in operations:
+            handler(self, statement)
         
         # Process any remaining classical operations
         self._flush_pending_classical_ops()
@@ -240,7 +310,7 @@ class QuantikzTranslator:
     def _process_classical_declaration(self, decl: Any):
         """Process classical bit declaration."""
         # Check if this is a BitType declaration
-        if hasattr(decl, 'type') and decl.type.__class__.__name__ == 'BitType':
+        if isinstance(getattr(decl, 'type', None), ast.BitType):
             name = decl.identifier.name
             
             # Get size from type
@@ -254,18 +324,23 @@ class QuantikzTranslator:
                 
             self.layout.add_classical_register(name, size)
     
-    def _advance_circuit(self):
-        """Ensure all rows have the same number of elements."""
-        if not self.circuit_rows:
-            return
-            
-        max_len = max(len(row) for row in self.circuit_rows)
-        for row in self.circuit_rows:
-            while len(row) < max_len:
-                row.append("\\qw")
+    def _sync_rows(self, row_ids):
+        """Start a new column on the given rows.
+        
+        Idle rows are not padded eagerly: a row only catches up with
+        ``\\qw`` when it is written again (or in the final pad of
+        ``_generate_latex``), so each operation touches just its own wires.
+        """
+        # The previous column ends after the longest row it wrote to
+        for r in self._active_rows:
+            self.next_column = max(self.next_column, len(self.circuit_rows[r]))
         
-        # Update current column position
-        self.current_column = max_len
+        self._active_rows = list(row_ids)
+        for r in self._active_rows:
+            row = self.circuit_rows[r]
+            delta = self.next_column - len(row)
+            if delta > 0:
+                row.extend((_QW,) * delta)
     
     def _process_gate(self, gate: Any):
         """Process a quantum gate."""
@@ -279,47 +354,44 @@ class QuantikzTranslator:
             return
         
         # Advance circuit
-        self._advance_circuit()
+        self._sync_rows(qubit_indices)
         
         # Apply gate based on type
-        if gate_name in self.standard_gates:
-            self._apply_standard_gate(gate_name, qubit_indices, gate)
-        elif gate_name.startswith('r'):
-            self._apply_rotation_gate(gate_name, qubit_indices, gate)
-        elif gate_name == 'u':
-            self._apply_u_gate(qubit_indices, gate)
-        else:
-            self._apply_custom_gate(gate_name, qubit_indices, gate)
+        handler = _GATE_HANDLERS.get(gate_name)
+        if handler is None:
+            handler = (QuantikzTranslator._apply_rotation_gate if gate_name.startswith('r')
+                       else QuantikzTranslator._apply_custom_gate)
+        handler(self, gate_name, qubit_indices, gate)
     
     def _apply_standard_gate(self, gate_name: str, qubits: List[int], gate: Any):
         """Apply a standard gate."""
         if len(qubits) == 1:
             # Single-qubit gate
-            self.circuit_rows[qubits[0]].append(f"\\gate{{{self.standard_gates[gate_name]}}}")
+            self.circuit_rows[qubits[0]].append(self._single_gate_tex[gate_name])
             
         elif len(qubits) == 2:
-            if gate_name in ['cx', 'cnot']:
+            if gate_name in _CNOT_NAMES:
                 # CNOT gate
                 ctrl, targ = qubits
-                self.circuit_rows[ctrl].append(f"\\ctrl{{{targ - ctrl}}}")
-                self.circuit_rows[targ].append("\\targ{}")
-            elif gate_name in ['cy', 'cz']:
+                self.circuit_rows[ctrl].append(_ctrl(targ - ctrl))
+                self.circuit_rows[targ].append(_TARG)
+            elif gate_name in _CYZ_NAMES:
                 # Controlled Y/Z
                 ctrl, targ = qubits
-                self.circuit_rows[ctrl].append(f"\\ctrl{{{targ - ctrl}}}")
-                self.circuit_rows[targ].append(f"\\gate{{{gate_name[1].upper()}}}")
+                self.circuit_rows[ctrl].append(_ctrl(targ - ctrl))
+                self.circuit_rows[targ].append(self._controlled_target_tex[gate_name])
             elif gate_name == 'swap':
                 # SWAP gate
                 q0, q1 = qubits
                 self.circuit_rows[q0].append(f"\\swap{{{q1 - q0}}}")
-                self.circuit_rows[q1].append("\\targX{}")
+                self.circuit_rows[q1].append(_TARGX)
                 
-        elif len(qubits) == 3 and gate_name in ['ccx', 'toffoli']:
+        elif len(qubits) == 3 and gate_name in _TOFFOLI_NAMES:
             # Toffoli gate
             ctrl1, ctrl2, targ = qubits
-            self.circuit_rows[ctrl1].append(f"\\ctrl{{{ctrl2 - ctrl1}}}")
-            self.circuit_rows[ctrl2].append(f"\\ctrl{{{targ - ctrl2}}}")
-            self.circuit_rows[targ].append("\\targ{}")
+            self.circuit_rows[ctrl1].append(_ctrl(ctrl2 - ctrl1))
+            self.circuit_rows[ctrl2].append(_ctrl(targ - ctrl2))
+            self.circuit_rows[targ].append(_TARG)
     
     def _apply_rotation_gate(self, gate_name: str, qubits: List[int], gate: Any):
         """Apply a rotation gate."""
@@ -342,7 +414,7 @@ class QuantikzTranslator:
         
         self.circuit_rows[qubits[0]].append(f"\\gate{{{gate_str}}}")
     
-    def _apply_u_gate(self, qubits: List[int], gate: Any):
+    def _apply_u_gate(self, gate_name: str, qubits: List[int], gate: Any):
         """Apply a U gate."""
         if len(qubits) != 1:
             self.errors.append("U gate requires exactly 1 qubit")
@@ -369,19 +441,24 @@ class QuantikzTranslator:
             self.circuit_rows[qubits[0]].append(f"\\gate{{{gate_str}}}")
         else:
             # Multi-qubit custom gate
-            min_q = min(qubits)
-            max_q = max(qubits)
+            min_q, max_q = _wire_extent(qubits)
             span = max_q - min_q + 1
             self.circuit_rows[min_q].append(f"\\gate[{span}]{{{gate_str}}}")
             # Other qubits just continue
             for q in qubits[1:]:
-                self.circuit_rows[q].append("\\qw")
+                self.circuit_rows[q].append(_QW)
     
     def _format_angle(self, expr: Any) -> str:
         """Format an angle expression."""
         if expr is None:
             return "?"
         
+        # Common angles (pi/2, theta, ...) repeat across a circuit, so format
+        # them once per canonical form
+        key = _angle_key(expr)
+        if key is not None:
+            return self._format_angle_cached(key)
+        
         # Handle different expression types
         if hasattr(expr, 'value'):
             return str(expr.value)
@@ -390,10 +467,10 @@ class QuantikzTranslator:
             name = expr.name
             if name == 'pi':
                 return '\\pi'
-            elif name in ['theta', 'phi', 'lambda', 'alpha', 'beta', 'gamma']:
+            elif name in _GREEK_PARAMS:
                 return f'\\{name}'
             return name
-        elif hasattr(expr, '__class__') and expr.__class__.__name__ == 'BinaryExpression':
+        elif isinstance(expr, ast.BinaryExpression):
             # Binary expression - handle properly
             if hasattr(expr, 'lhs') and hasattr(expr, 'rhs') and hasattr(expr, 'op'):
                 left = self._format_angle(expr.lhs)
@@ -418,15 +495,37 @@ class QuantikzTranslator:
             # Fallback
             return str(expr)
         else:
-            # Try to extract numeric value
-            if hasattr(expr, '__str__'):
-                s = str(expr)
-                # Simple pattern matching for common cases
-                if 'pi/2' in s:
-                    return '\\frac{\\pi}{2}'
-                elif 'pi/4' in s:
-                    return '\\frac{\\pi}{4}'
-            return str(expr)
+            # Try to extract a common fraction of pi from the text form
+            s = str(expr)
+            match = _PI_FRACTION_RE.search(s)
+            if match:
+                return _PI_FRACTIONS[match.group(1)]
+            return s
+    
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _format_angle_cached(key: Tuple) -> str:
+        """Format an angle from its canonical key (see ``_angle_key``)."""
+        kind = key[0]
+        if kind == 'value':
+            return str(key[2])
+        if kind == 'name':
+            name = key[1]
+            if name == 'pi':
+                return '\\pi'
+            elif name in _GREEK_PARAMS:
+                return f'\\{name}'
+            return name
+        
+        # Binary expression
+        _, op, lhs, rhs = key
+        left = QuantikzTranslator._format_angle_cached(lhs)
+        right = QuantikzTranslator._format_angle_cached(rhs)
+        if op == '/':
+            return f"\\frac{{{left}}}{{{right}}}"
+        elif op == '*':
+            return f"{left} \\cdot {right}"
+        return f"{left} {op} {right}"
     
     def _process_measurement(self, meas: Any, target: Any = None):
         """Process measurement operation.
@@ -445,14 +544,12 @@ class QuantikzTranslator:
             self.errors.append(str(e))
             return
         
-        self._advance_circuit()
-        
         # Track measurement location BEFORE adding it
         actual_target = target if target is not None else (meas.target if hasattr(meas, 'target') else None)
         cbit_key = None
         if actual_target is not None:
             # Extract classical bit name and index
-            if hasattr(actual_target, '__class__') and actual_target.__class__.__name__ == 'IndexedIdentifier':
+            if isinstance(actual_target, ast.IndexedIdentifier):
                 cbit_name = actual_target.name.name
                 if hasattr(actual_target, 'indices') and actual_target.indices:
                     idx_expr = actual_target.indices[0][0]
@@ -468,25 +565,20 @@ class QuantikzTranslator:
             else:
                 cbit_key = str(actual_target)
             
-            # Store measurement location
-            if cbit_key not in self.measurement_map:
-                self.measurement_map[cbit_key] = []
-            self.measurement_map[cbit_key].append((qubit_idx, self.current_column))
-        
         # Now place measurement and any gates controlled by this bit in the SAME column
         # First, find gates controlled by this measurement
         gates_to_place = []
-        if cbit_key and self.pending_classical_ops:
-            remaining_ops = []
-            for key, gate in self.pending_classical_ops:
-                if key == cbit_key:
-                    gates_to_place.append(gate)
-                else:
-                    remaining_ops.append((key, gate))
-            self.pending_classical_ops = remaining_ops
+        if cbit_key:
+            gates_to_place = self.pending_classical_ops.pop(cbit_key, [])
         
-        # Track which qubits have operations in this column
-        placed_on_qubits = {qubit_idx}  # Measurement qubit
+        # Open the column on the measured qubit and every controlled gate's wires
+        column_rows = {qubit_idx}
+        for gate in gates_to_place:
+            try:
+                column_rows.update([self.layout.get_qubit_index(q) for q in gate.qubits])
+            except ValueError:
+                continue
+        self._sync_rows(sorted(column_rows))
         
         # Place controlled gates FIRST (so we can modify the measurement if needed)
         for gate in gates_to_place:
@@ -500,18 +592,14 @@ class QuantikzTranslator:
             
             # Place the gate
             if len(gate_qubits) == 1:
-                if gate_name in self.standard_gates:
-                    gate_str = self.standard_gates[gate_name]
-                else:
-                    gate_str = gate_name.upper()
-                self.circuit_rows[target_qubit].append(f"\\gate{{{gate_str}}}")
-                placed_on_qubits.add(target_qubit)
-            elif len(gate_qubits) == 2 and gate_name in ['cx', 'cnot']:
+                gate_tex = self._single_gate_tex.get(gate_name)
+                if gate_tex is None:
+                    gate_tex = f"\\gate{{{gate_name.upper()}}}"
+                self.circuit_rows[target_qubit].append(gate_tex)
+            elif len(gate_qubits) == 2 and gate_name in _CNOT_NAMES:
                 ctrl_idx, targ_idx = gate_qubits
-                self.circuit_rows[ctrl_idx].append(f"\\ctrl{{{targ_idx - ctrl_idx}}}")
-                self.circuit_rows[targ_idx].append("\\targ{}")
-                placed_on_qubits.add(ctrl_idx)
-                placed_on_qubits.add(targ_idx)
+                self.circuit_rows[ctrl_idx].append(_ctrl(targ_idx - ctrl_idx))
+                self.circuit_rows[targ_idx].append(_TARG)
         
         # Now place measurement with wire if needed
         if gates_to_place:
@@ -529,34 +617,25 @@ class QuantikzTranslator:
             
             if wire_needed and wire_targets:
                 # Find the furthest target for the wire
-                distances = [abs(t - qubit_idx) for t in wire_targets]
-                max_dist_idx = distances.index(max(distances))
-                target = wire_targets[max_dist_idx]
-                distance = abs(target - qubit_idx)
-                direction = 'd' if target > qubit_idx else 'u'
-                self.circuit_rows[qubit_idx].append(f"\\meter{{}}\\wire[{direction}][{distance}]{{c}}")
+                target = max(wire_targets, key=lambda t: abs(t - qubit_idx))
+                self.circuit_rows[qubit_idx].append(_meter_wire(target - qubit_idx))
             else:
-                self.circuit_rows[qubit_idx].append("\\meter{}")
+                self.circuit_rows[qubit_idx].append(_METER)
         else:
             # No controlled gates, just place measurement
-            self.circuit_rows[qubit_idx].append("\\meter{}")
-        
-        # Fill \qw for qubits that don't have operations in this column
-        for i in range(self.layout.total_qubits):
-            if i not in placed_on_qubits:
-                self.circuit_rows[i].append("\\qw")
+            self.circuit_rows[qubit_idx].append(_METER)
         
         # Add classical wire type after the measurement column
         # But check if a reset is coming next - if so, skip the wire type change
         if cbit_key:
             # Look ahead to see if reset is next for this qubit
             # For now, always add the classical wire type - we'll handle it in reset
-            self._advance_circuit()
+            self._sync_rows([qubit_idx])
             self.circuit_rows[qubit_idx].append("\\setwiretype{c}")
-            # Fill other qubits
-            for i in range(self.layout.total_qubits):
-                if i != qubit_idx:
-                    self.circuit_rows[i].append("\\qw")
+    
+    def _process_measurement_statement(self, statement: Any):
+        """Process a measurement statement by unwrapping the measurement."""
+        self._process_measurement(statement.measure, statement.target)
     
     def _process_barrier(self, barrier: Any):
         """Process barrier operation."""
@@ -570,17 +649,13 @@ class QuantikzTranslator:
             # Barrier on all qubits
             qubit_indices = list(range(self.layout.total_qubits))
         
-        self._advance_circuit()
+        if not qubit_indices:
+            return
         
-        # Add barrier
-        for i, row in enumerate(self.circuit_rows):
-            if i in qubit_indices:
-                if i == min(qubit_indices):
-                    row.append(f"\\barrier{{{len(qubit_indices)}}}")
-                else:
-                    row.append("\\qw")
-            else:
-                row.append("\\qw")
+        # Add barrier; the other wires are padded when next written
+        first = min(qubit_indices)
+        self._sync_rows([first])
+        self.circuit_rows[first].append(f"\\barrier{{{len(qubit_indices)}}}")
     
     def _process_reset(self, reset: Any):
         """Process reset operation.
@@ -595,31 +670,31 @@ class QuantikzTranslator:
             return
         
         # Move to next column for reset
-        self._advance_circuit()
+        self._sync_rows([qubit_idx])
         
         # First, add a measurement (to show we're discarding the current state)
-        self.circuit_rows[qubit_idx].append("\\meter{}")
+        self.circuit_rows[qubit_idx].append(_METER)
         
         # Advance to next column
-        self._advance_circuit()
+        self._sync_rows([qubit_idx])
         
         # Cut the wire with setwiretype{n}
         self.circuit_rows[qubit_idx].append("\\setwiretype{n}")
         
         # Advance to next column
-        self._advance_circuit()
+        self._sync_rows([qubit_idx])
         
         # Restart the wire with |0⟩
         self.circuit_rows[qubit_idx].append("\\lstick{$|0\\rangle$}")
         
         # Advance to next column
-        self._advance_circuit()
+        self._sync_rows([qubit_idx])
         
         # Set back to quantum wire
         self.circuit_rows[qubit_idx].append("\\setwiretype{q}\\qw")
         
         # Continue with quantum wire after reset
-        # No need to fill other qubits as _advance_circuit handles that
+        # No need to fill other qubits as _sync_rows handles that
     
     def _process_branching(self, branch: Any):
         """Process if statement with classical control."""
@@ -635,17 +710,18 @@ class QuantikzTranslator:
         if hasattr(condition, 'name'):
             # Simple identifier (e.g., if (c))
             cbit_name = condition.name
-            cbit_indices = self._get_classical_bit_indices(cbit_name)
-            if len(cbit_indices) == 0:
+            reg = self.layout.classical_registers.get(cbit_name)
+            size = reg["size"] if reg is not None else 0
+            if size == 0:
                 self.errors.append(f"Classical bit {cbit_name} not found")
                 return
-            elif len(cbit_indices) > 1:
-                self.warnings.append(f"Classical control on register {cbit_name} with {len(cbit_indices)} bits - using first bit")
+            elif size > 1:
+                self.warnings.append(f"Classical control on register {cbit_name} with {size} bits - using first bit")
                 cbit_key = f"{cbit_name}[0]"
             else:
                 cbit_key = cbit_name
                 
-        elif hasattr(condition, '__class__') and condition.__class__.__name__ == 'IndexExpression':
+        elif isinstance(condition, ast.IndexExpression):
             # Index expression (e.g., if (c[1]))
             if hasattr(condition, 'collection') and hasattr(condition.collection, 'name'):
                 cbit_name = condition.collection.name
@@ -672,9 +748,9 @@ class QuantikzTranslator:
         
         # Collect the gates in the if block for later processing
         for stmt in branch.if_block:
-            if hasattr(stmt, '__class__') and stmt.__class__.__name__ == 'QuantumGate':
+            if isinstance(stmt, ast.QuantumGate):
                 # Store this classically controlled gate for later processing
-                self.pending_classical_ops.append((cbit_key, stmt))
+                self.pending_classical_ops[cbit_key].append(stmt)
             else:
                 self.warnings.append(f"Classical control of {type(stmt).__name__} not supported")
     
@@ -683,149 +759,132 @@ class QuantikzTranslator:
         # Since we now handle classically controlled gates directly in _process_measurement,
         # this method should only handle any remaining operations that weren't matched
         # to measurements (which would be an error case)
-        if self.pending_classical_ops:
-            for cbit_key, gate in self.pending_classical_ops:
+        for cbit_key, gates in self.pending_classical_ops.items():
+            for gate in gates:
                 self.warnings.append(f"Classical control on {cbit_key} has no corresponding measurement")
     
-    def _is_next_statement_measurement(self, statements: List[Any], current_index: int) -> bool:
-        """Check if the next statement is a measurement."""
-        if current_index + 1 >= len(statements):
-            return False
-        
-        next_stmt = statements[current_index + 1]
-        if hasattr(next_stmt, '__class__'):
-            stmt_type = next_stmt.__class__.__name__
-            return stmt_type in ['QuantumMeasurement', 'QuantumMeasurementStatement']
-        return False
-    
-    def _get_classical_bit_indices(self, name: str) -> List[int]:
-        """Get indices for classical bits."""
-        if name in self.layout.classical_registers:
-            reg = self.layout.classical_registers[name]
-            return list(range(reg["start"], reg["start"] + reg["size"]))
-        return []
-    
-    def _process_classical_controlled_gate(self, gate: Any, cbit_key: str):
-        """Process a classically controlled gate with explicit wire routing."""
-        gate_name = gate.name.name.lower()
-        
-        # Get qubit indices
-        try:
-            qubit_indices = [self.layout.get_qubit_index(q) for q in gate.qubits]
-        except ValueError as e:
-            self.errors.append(str(e))
-            return
-        
-        # Find the measurement source for this classical bit
-        measure_info = None
-        if cbit_key in self.measurement_map:
-            # Get the most recent measurement for this bit
-            measure_qubit, measure_col = self.measurement_map[cbit_key][-1]
-            measure_info = (measure_qubit, measure_col)
-            target_qubit = qubit_indices[0]  # Primary target for single-qubit gates
-            
-            # Track that we need classical control
-            self.has_classical_control = True
-        
-        # Advance circuit
-        self._advance_circuit()
-        
-        # Apply the gate first
-        if len(qubit_indices) == 1:
-            qubit_idx = qubit_indices[0]
-            
-            # Add the classically controlled gate
-            if gate_name in self.standard_gates:
-                gate_str = self.standard_gates[gate_name]
-            else:
-                gate_str = gate_name.upper()
-            
-            # Add gate with classical input
-            self.circuit_rows[qubit_idx].append(f"\\gate{{{gate_str}}}")
-            
-        elif len(qubit_indices) == 2 and gate_name in ['cx', 'cnot']:
-            # Classically controlled CNOT
-            ctrl_idx, targ_idx = qubit_indices
-            self.circuit_rows[ctrl_idx].append(f"\\ctrl{{{targ_idx - ctrl_idx}}}")
-            self.circuit_rows[targ_idx].append("\\targ{}")
-        else:
-            # General multi-qubit gate with classical control
-            min_q = min(qubit_indices)
-            max_q = max(qubit_indices)
-            span = max_q - min_q + 1
-            self.circuit_rows[min_q].append(f"\\gate[{span}]{{{gate_name.upper()}}}")
-            for q in qubit_indices[1:]:
-                self.circuit_rows[q].append("\\qw")
-        
-        # Now handle classical wire routing after gate is placed
-        if measure_info:
-            measure_qubit, measure_col = measure_info
-            target_qubit = qubit_indices[0]
-            
-            if measure_qubit != target_qubit:
-                # We need to add a vertical wire connection
-                distance = abs(target_qubit - measure_qubit)
-                direction = 'd' if target_qubit > measure_qubit else 'u'
-                
-                # The gate is now placed on the target row
-                # We need to place the wire one column before the gate
-                target_length = len(self.circuit_rows[target_qubit])
-                current_length = len(self.circuit_rows[measure_qubit])
-                
-                # Fill gaps to align with one column before the gate
-                while current_length < target_length - 1:
-                    self.circuit_rows[measure_qubit].append("\\qw")
-                    current_length += 1
-                
-                # Now add the wire
-                self.circuit_rows[measure_qubit].append(f"\\wire[{direction}][{distance}]{{c}}")
-    
     def _generate_latex(self) -> str:
         """Generate the final quantikz LaTeX code."""
         if self.errors:
             raise ValueError(f"Translation errors:\\n" + "\\n".join(self.errors))
         
         # Ensure all rows are same length and add final wire
-        self._advance_circuit()
+        self._sync_rows(range(self.layout.total_qubits))
         for row in self.circuit_rows:
-            row.append("\\qw")
-        
-        # Build LaTeX
-        lines = ["\\begin{quantikz}"]
-        
-        # Add rows with labels
-        for i in range(self.layout.total_qubits):
-            # Find register and index
-            label = None
-            for reg_name, reg_map in self.layout.qubit_registers.items():
-                if reg_map.start_index <= i < reg_map.start_index + reg_map.size:
-                    idx = i - reg_map.start_index
-                    if reg_map.size > 1:
-                        label = f"{reg_name}[{idx}]"
-                    else:
-                        label = reg_name
-                    break
-            
-            # Build row
+            row.append(_QW)
+        
+        # Build LaTeX as one fragment list, joined once at the end
+        out = ["\\begin{quantikz}\n"]
+        last = self.layout.total_qubits - 1
+        for i, (label, row) in enumerate(zip(self._qubit_labels, self.circuit_rows)):
+            out.append("    ")
             if label:
-                row_str = f"\\lstick{{$|{label}\\rangle$}} & " + " & ".join(self.circuit_rows[i])
-            else:
-                row_str = " & ".join(self.circuit_rows[i])
+                out.append("\\lstick{$|")
+                out.append(label)
+                out.append("\\rangle$} & ")
+            out.append(" & ".join(row))
             
             # Add line terminator
-            if i < self.layout.total_qubits - 1:
-                row_str += " \\\\"
-            
-            lines.append("    " + row_str)
+            out.append(" \\\\\n" if i < last else "\n")
         
-        lines.append("\\end{quantikz}")
+        out.append("\\end{quantikz}")
         
-        return "\n".join(lines)
+        return "".join(out)
+
+
+def _wire_extent(qubits: List[int]) -> Tuple[int, int]:
+    """Lowest and highest wire of a gate, found in a single scan."""
+    lo = hi = qubits[0]
+    for q in qubits:
+        if q < lo:
+            lo = q
+        elif q > hi:
+            hi = q
+    return lo, hi
+
+
+# Fractions of pi recognised in the text of otherwise unsupported angles
+_PI_FRACTIONS = {d: f"\\frac{{\\pi}}{{{d}}}" for d in ('2', '3', '4', '6', '8')}
+_PI_FRACTION_RE = re.compile(r'pi/([23468])(?!\d)')
+
+# Binary operator names understood by _format_angle, mapped to their symbol
+_ANGLE_OPERATORS = {
+    'SLASH': '/', '/': '/', 'STAR': '*', '*': '*',
+    'PLUS': '+', '+': '+', 'MINUS': '-', '-': '-',
+}
+
+
+def _angle_key(expr: Any) -> Optional[Tuple]:
+    """Hashable canonical form of an angle expression, ignoring source spans.
+    
+    Returns None for anything whose formatting depends on more than the
+    literal values, names and operators, which is then formatted uncached.
+    """
+    if hasattr(expr, 'value'):
+        value = expr.value
+        # Keep the type so that 1, 1.0 and True do not share an entry
+        if isinstance(value, (int, float, str)):
+            return ('value', type(value).__name__, value)
+        return None
+    if hasattr(expr, 'name'):
+        return ('name', expr.name) if isinstance(expr.name, str) else None
+    if isinstance(expr, ast.BinaryExpression):
+        op = _ANGLE_OPERATORS.get(getattr(expr.op, 'name', None))
+        if op is None:
+            return None
+        lhs = _angle_key(expr.lhs)
+        rhs = _angle_key(expr.rhs)
+        if lhs is None or rhs is None:
+            return None
+        return ('binop', op, lhs, rhs)
+    return None
+
+
+# Gate name -> handler(translator, gate_name, qubits, gate), shared by all
+# translators so that creating one does not rebuild the table
+_GATE_HANDLERS: Dict[str, Callable] = {
+    name: QuantikzTranslator._apply_standard_gate for name in QuantikzTranslator.standard_gates
+}
+_GATE_HANDLERS.update(dict.fromkeys(('rx', 'ry', 'rz'), QuantikzTranslator._apply_rotation_gate))
+_GATE_HANDLERS['u'] = QuantikzTranslator._apply_u_gate
+
+
+# Statement handlers keyed by AST node type, so each statement is dispatched
+# with a single dict lookup on type(statement) instead of name comparisons.
+# Each entry records the translation phase the handler belongs to.
+_DECLARATION = "declaration"
+_BRANCHING = "branching"
+_OPERATION = "operation"
+
+# Filled by _load_openqasm once the AST node types are available
+_STATEMENT_HANDLERS: Dict[type, Tuple[str, Callable]] = {}
+
+
+def _load_openqasm():
+    """Import openqasm3 on first use and build the type-keyed tables."""
+    global openqasm3, ast, _STATEMENT_HANDLERS
+    if ast is not None:
+        return
+    
+    import openqasm3
+    from openqasm3 import ast
+    
+    _STATEMENT_HANDLERS = {
+        ast.QubitDeclaration: (_DECLARATION, QuantikzTranslator._process_qubit_declaration),
+        ast.ClassicalDeclaration: (_DECLARATION, QuantikzTranslator._process_classical_declaration),
+        ast.BranchingStatement: (_BRANCHING, QuantikzTranslator._process_branching),
+        ast.QuantumGate: (_OPERATION, QuantikzTranslator._process_gate),
+        ast.QuantumMeasurement: (_OPERATION, QuantikzTranslator._process_measurement),
+        ast.QuantumMeasurementStatement: (_OPERATION, QuantikzTranslator._process_measurement_statement),
+        ast.QuantumBarrier: (_OPERATION, QuantikzTranslator._process_barrier),
+        ast.QuantumReset: (_OPERATION, QuantikzTranslator._process_reset),
+    }
 
 
 def print_tex(openqasm_string: str, latex: bool = False, save_fig: bool = False,
               filename: Optional[str] = None, show: bool = True, 
-              border: str = "2pt", options: Optional[Dict[str, str]] = None) -> Optional[str]:
+              border: str = "2pt", options: Optional[Dict[str, str]] = None,
+              name: Optional[str] = None) -> Optional[str]:
     """
     Convert OpenQASM3 string to quantikz visualization.
     
@@ -839,7 +898,7 @@ def print_tex(openqasm_string: str, latex: bool = False, save_fig: bool = False,
         If True, save the figure to a file
     filename : str, optional
         Filename for saving the figure. If None and save_fig=True, 
-        attempts to extract variable name from calling frame
+        uses ``name`` or else the caller's variable holding the circuit
     show : bool, default=True
         If True, display the figure (when not in latex mode)
     border : str, default="2pt"
@@ -848,18 +907,99 @@ def print_tex(openqasm_string: str, latex: bool = False, save_fig: bool = False,
         Dictionary of quantikz options. Supported keys:
         - "height": row separation (e.g., "2mm", "10pt")
         - "width": column separation (e.g., "2mm", "10pt")
+    name : str, optional
+        Base name for the saved file (``<name>.pdf``) when no filename
+        is given
     
     Returns:
     --------
     str or None
         LaTeX code if latex=True, otherwise None
     """
-    if not OPENQASM_AVAILABLE:
-        raise ImportError(
-            "OpenQASM3 is not installed. Install it with:\\n"
-            "pip install openqasm3"
-        )
+    quantikz_code = _translate(openqasm_string, options)
+    
+    if latex:
+        return quantikz_code
+    
+    # Handle filename for save_fig
+    if save_fig and filename is None:
+        if name is None:
+            name = _caller_variable_name(openqasm_string)
+        filename = f"{name}.pdf" if name else "quantum_circuit.pdf"
     
+    # Compile and display/save
+    if save_fig or show:
+        _render([quantikz_code], border, filename if save_fig else None, show)
+
+
+def _caller_variable_name(value: str) -> Optional[str]:
+    """Name of the variable in print_tex's caller that holds ``value``.
+    
+    Matches by identity: the caller passes the very object bound to its
+    variable, so no string contents are compared.
+    """
+    frame = sys._getframe(2)
+    try:
+        for var_name, var_value in frame.f_locals.items():
+            if var_value is value:
+                return var_name
+        return None
+    finally:
+        del frame
+
+
+def print_tex_many(openqasm_strings: List[str], latex: bool = False, save_fig: bool = False,
+                   filename: Optional[str] = None, show: bool = True,
+                   border: str = "2pt", options: Optional[Dict[str, str]] = None) -> Optional[List[str]]:
+    """
+    Convert several OpenQASM3 strings to quantikz with a single LaTeX run.
+    
+    Each circuit becomes one page of the same standalone document, so
+    pdflatex is started (and loads its format) once for the whole batch
+    instead of once per circuit.
+    
+    Parameters:
+    -----------
+    openqasm_strings : list of str
+        OpenQASM3 circuit descriptions
+    latex : bool, default=False
+        If True, return the LaTeX code of each circuit instead of rendering
+    save_fig : bool, default=False
+        If True, save all circuits to one multi-page PDF
+    filename : str, optional
+        Filename for the saved PDF (default: "quantum_circuits.pdf")
+    show : bool, default=True
+        If True, display every circuit (when not in latex mode)
+    border : str, default="2pt"
+        Border size around each circuit
+    options : dict, optional
+        Quantikz options applied to every circuit, as in ``print_tex``
+    
+    Returns:
+    --------
+    list of str or None
+        LaTeX code of each circuit if latex=True, otherwise None
+    """
+    codes = [_translate(s, options) for s in openqasm_strings]
+    
+    if latex:
+        return codes
+    
+    if save_fig and filename is None:
+        filename = "quantum_circuits.pdf"
+    
+    if codes and (save_fig or show):
+        _render(codes, border, filename if save_fig else None, show)
+
+
+@lru_cache(maxsize=128)
+def _translate_cached(openqasm_string: str) -> Tuple[str, Tuple[str, ...]]:
+    """Translate OpenQASM3 source to ``(quantikz_code, warnings)``, memoized.
+    
+    A repeated render of the same source skips both the parse and the AST
+    walk. Only the resulting strings are kept, not the AST. Failed
+    translations raise and are therefore not cached.
+    """
     # Parse OpenQASM
     try:
         qasm_ast = openqasm3.parse(openqasm_string)
@@ -869,11 +1009,91 @@ def print_tex(openqasm_string: str, latex: bool = False, save_fig: bool = False,
     # Translate to quantikz
     translator = QuantikzTranslator()
     quantikz_code = translator.translate(qasm_ast)
+    return quantikz_code, tuple(translator.warnings)
+
+
+def print_tex_batch(openqasm_strings: List[str], filenames: Optional[List[str]] = None,
+                    show: bool = False, border: str = "2pt",
+                    options: Optional[Dict[str, str]] = None,
+                    max_workers: Optional[int] = None) -> Optional[List[str]]:
+    """
+    Compile several OpenQASM3 circuits to separate PDF files in parallel.
+    
+    The circuits are translated in this process (sharing the translation
+    cache), and each one is then compiled by its own pdflatex
+    process. pdflatex is single-threaded, so the compiles run side by side
+    on the available cores. Use ``print_tex_many`` instead when one
+    multi-page PDF is enough.
+    
+    Parameters:
+    -----------
+    openqasm_strings : list of str
+        OpenQASM3 circuit descriptions
+    filenames : list of str, optional
+        Output PDF for each circuit (default: "quantum_circuit_<i>.pdf")
+    show : bool, default=False
+        If True, also display every circuit
+    border : str, default="2pt"
+        Border size around each circuit
+    options : dict, optional
+        Quantikz options applied to every circuit, as in ``print_tex``
+    max_workers : int, optional
+        Number of concurrent pdflatex processes (default: CPU count)
+    
+    Returns:
+    --------
+    list of str or None
+        The files written, or None if pdflatex could not be found
+    """
+    codes = [_translate(s, options) for s in openqasm_strings]
+    
+    if filenames is None:
+        filenames = [f"quantum_circuit_{i}.pdf" for i in range(len(codes))]
+    elif len(filenames) != len(codes):
+        raise ValueError(
+            f"Got {len(filenames)} filenames for {len(codes)} circuits"
+        )
+    
+    _ensure_latex_path()
+    
+    # Each worker thread only waits on its pdflatex subprocess, so threads
+    # are enough to keep one compile per core busy
+    from concurrent.futures import ThreadPoolExecutor
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            pdfs = list(executor.map(partial(_compile_pdf_bytes, border=border), codes))
+    except FileNotFoundError as e:
+        print(f"Required tool not found: {e}")
+        return None
     
-    # Show warnings if any
-    if translator.warnings:
+    for pdf, filename in zip(pdfs, filenames):
+        with open(filename, 'wb') as f:
+            f.write(pdf)
+        print(f"Circuit saved to {filename}")
+    
+    if show:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for filename in filenames:
+                _display_pdf(filename, 1, tmpdir)
+    
+    return filenames
+
+
+def _translate(openqasm_string: str, options: Optional[Dict[str, str]] = None) -> str:
+    """Parse an OpenQASM3 string and return its quantikz environment."""
+    if not OPENQASM_AVAILABLE:
+        raise ImportError(
+            "OpenQASM3 is not installed. Install it with:\\n"
+            "pip install openqasm3"
+        )
+    _load_openqasm()
+    
+    quantikz_code, warnings = _translate_cached(openqasm_string)
+    
+    # Show warnings if any (replayed on cache hits too)
+    if warnings:
         print("Warnings:")
-        for warning in translator.warnings:
+        for warning in warnings:
             print(f"  - {warning}")
     
     # Apply options if provided
@@ -896,115 +1116,324 @@ def print_tex(openqasm_string: str, latex: bool = False, save_fig: bool = False,
                 f"\\begin{{quantikz}}[{', '.join(option_parts)}]"
             )
     
-    if latex:
-        return quantikz_code
+    return quantikz_code
+
+
+def _pdf_to_png(pdf_file: str, n_pages: int, tmpdir: str) -> List[Union[bytes, str]]:
+    """Rasterize each page of a compiled circuit PDF at 150 DPI for display.
     
-    # Handle filename for save_fig
-    if save_fig and filename is None:
-        # Try to extract variable name from calling frame
-        import inspect
-        frame = inspect.currentframe()
+    Renders in-process with pypdfium2 when it is installed and returns the
+    PNG bytes; otherwise converts with ImageMagick and returns file paths.
+    """
+    try:
+        import pypdfium2 as pdfium
+    except ImportError:
+        pdfium = None
+    
+    if pdfium is not None:
+        import io
+        pngs = []
+        pdf = pdfium.PdfDocument(pdf_file)
+        try:
+            for page in pdf:
+                buf = io.BytesIO()
+                page.render(scale=150 / 72).to_pil().save(buf, 'PNG')
+                pngs.append(buf.getvalue())
+        finally:
+            pdf.close()
+        return pngs
+    
+    # Convert to PNG for display
+    png_file = os.path.join(tmpdir, "circuit.png")
+    
+    # Try magick first (ImageMagick 7+), then convert (ImageMagick 6)
+    convert_cmds = [
+        ['magick', 'convert', '-density', '150', pdf_file, png_file],
+        ['magick', '-density', '150', pdf_file, png_file],
+        ['convert', '-density', '150', pdf_file, png_file]
+    ]
+    
+    for cmd in convert_cmds:
+        try:
+            result = subprocess.run(cmd, capture_output=True)
+            if result.returncode == 0:
+                break
+        except FileNotFoundError:
+            continue
+    else:
+        raise RuntimeError("ImageMagick not found")
+    
+    # A multi-page PDF is written as circuit-0.png, circuit-1.png, ...
+    if n_pages == 1:
+        return [png_file]
+    return [os.path.join(tmpdir, f"circuit-{i}.png") for i in range(n_pages)]
+
+
+# Standalone document wrapped around the quantikz environments. The header
+# is also what gets dumped into the precompiled format (_preamble_format).
+_LATEX_HEADER = """\\documentclass[tikz,border=%s]{standalone}
+\\usepackage{tikz}
+\\usetikzlibrary{quantikz2}
+"""
+_LATEX_BEGIN = """
+\\begin{document}
+"""
+_LATEX_POSTAMBLE = """
+\\end{document}"""
+
+
+def _render(quantikz_codes: List[str], border: str, filename: Optional[str], show: bool):
+    """Compile quantikz environments in one pdflatex run, then save and/or display.
+    
+    With the ``tikz`` option, standalone puts every picture on its own
+    page, so a batch of circuits yields one page per circuit.
+    """
+    _ensure_latex_path()
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
         try:
-            # Get caller's frame
-            caller_frame = frame.f_back
-            # Get local variables
-            caller_locals = caller_frame.f_locals
+            pdf_file = _compile_pdf(quantikz_codes, border, tmpdir)
             
-            # Find variable name that matches our openqasm_string
-            var_name = None
-            for name, value in caller_locals.items():
-                if isinstance(value, str) and value == openqasm_string:
-                    var_name = name
-                    break
+            if filename is not None:
+                import shutil
+                shutil.copy(pdf_file, filename)
+                print(f"Circuit saved to {filename}")
             
-            if var_name:
-                filename = f"{var_name}.pdf"
-            else:
-                filename = "quantum_circuit.pdf"
-        finally:
-            del frame
+            if show:
+                _display_pdf(pdf_file, len(quantikz_codes), tmpdir)
+                    
+        except FileNotFoundError as e:
+            print(f"Required tool not found: {e}")
+            print("\\nGenerated LaTeX code:")
+            print("\n\n".join(quantikz_codes))
+
+
+# Guards building the precompiled format when batches compile concurrently
+_format_lock = threading.Lock()
+
+# Precompiled formats by border: the format path, or None when it could
+# not be built in this process
+_FORMATS: Dict[str, Optional[str]] = {}
+
+
+def _cache_dir(*parts: str) -> str:
+    """Per-user qsip cache directory (``$XDG_CACHE_HOME/qsip`` or ``~/.cache/qsip``)."""
+    cache_root = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_root, "qsip", *parts)
+
+
+@lru_cache(maxsize=None)
+def _pdflatex_version() -> Optional[str]:
+    """First line of ``pdflatex --version``, or None if it cannot be run."""
+    try:
+        result = subprocess.run([_resolve_pdflatex(), '--version'], stdin=subprocess.DEVNULL,
+                                capture_output=True, text=True)
+    except OSError:
+        return None
+    lines = result.stdout.splitlines()
+    if result.returncode != 0 or not lines:
+        return None
+    return lines[0]
+
+
+def _preamble_format(border: str) -> Optional[str]:
+    """Dump the document header into a pdflatex format, once per border.
     
-    # Create full LaTeX document
-    latex_doc = f"""\\documentclass[tikz,border={border}]{{standalone}}
-\\usepackage{{tikz}}
-\\usetikzlibrary{{quantikz2}}
+    Loading tikz and the quantikz library dominates a small compile, so the
+    header is processed a single time with ``pdflatex -ini ... \\dump`` and
+    later runs start from the saved state via ``-fmt``. Formats are kept in
+    the per-user cache directory, keyed by a hash of the pdflatex version
+    and the header, and are built in a private directory and moved into
+    place, so a partial file is never picked up. Returns the format path
+    without its ``.fmt`` suffix, or None if it could not be built, in which
+    case the full preamble is compiled as before.
+    """
+    with _format_lock:
+        if border in _FORMATS:
+            return _FORMATS[border]
+        fmt_path = _build_format(border)
+        _FORMATS[border] = fmt_path
+        return fmt_path
 
-\\begin{{document}}
-{quantikz_code}
-\\end{{document}}"""
+
+def _build_format(border: str) -> Optional[str]:
+    """Find or build the format for ``border``; see _preamble_format."""
+    version = _pdflatex_version()
+    if version is None:
+        return None
+    header = _LATEX_HEADER % border
+    key = hashlib.sha256(f"{version}\0{header}".encode()).hexdigest()[:16]
+    fmt_dir = _cache_dir("fmt")
+    jobname = f"quantikz-{key}"
+    fmt_path = os.path.join(fmt_dir, jobname)
+    if os.path.exists(fmt_path + ".fmt"):
+        return fmt_path
     
-    # Compile and display/save
-    if save_fig or show:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Write LaTeX file
-            tex_file = os.path.join(tmpdir, "circuit.tex")
+    try:
+        os.makedirs(fmt_dir, mode=0o700, exist_ok=True)
+        with tempfile.TemporaryDirectory(dir=fmt_dir) as build_dir:
+            tex_file = os.path.join(build_dir, jobname + ".tex")
             with open(tex_file, 'w') as f:
-                f.write(latex_doc)
-            
-            # Compile to PDF
-            try:
-                # Try to find pdflatex
-                pdflatex_cmd = 'pdflatex'
-                
-                # Check if pdflatex is available
-                try:
-                    subprocess.run(['which', pdflatex_cmd], capture_output=True, check=True)
-                except:
-                    # Try common paths
-                    for path in ['/Library/TeX/texbin/pdflatex', '/usr/local/bin/pdflatex']:
-                        if os.path.exists(path):
-                            pdflatex_cmd = path
-                            break
-                
-                result = subprocess.run(
-                    [pdflatex_cmd, '-interaction=nonstopmode', tex_file],
-                    cwd=tmpdir,
-                    capture_output=True,
-                    text=True
-                )
-                
-                if result.returncode != 0:
-                    print("LaTeX compilation failed:")
-                    print(result.stdout[-1000:])  # Last 1000 chars
-                    raise RuntimeError("Failed to compile LaTeX")
-                
-                pdf_file = os.path.join(tmpdir, "circuit.pdf")
-                
-                if save_fig:
-                    import shutil
-                    shutil.copy(pdf_file, filename)
-                    print(f"Circuit saved to {filename}")
-                
-                if show:
-                    # Try to display in Jupyter
-                    try:
-                        from IPython.display import Image, display
-                        # Convert to PNG for display
-                        png_file = os.path.join(tmpdir, "circuit.png")
-                        
-                        # Try magick first (ImageMagick 7+), then convert (ImageMagick 6)
-                        convert_cmds = [
-                            ['magick', 'convert', '-density', '150', pdf_file, png_file],
-                            ['magick', '-density', '150', pdf_file, png_file],
-                            ['convert', '-density', '150', pdf_file, png_file]
-                        ]
-                        
-                        for cmd in convert_cmds:
-                            try:
-                                result = subprocess.run(cmd, capture_output=True)
-                                if result.returncode == 0:
-                                    break
-                            except FileNotFoundError:
-                                continue
-                        else:
-                            raise RuntimeError("ImageMagick not found")
-                        
-                        display(Image(png_file))
-                    except Exception as e:
-                        print(f"Could not display image: {e}")
-                        print("Circuit PDF generated successfully.")
-                        
-            except FileNotFoundError as e:
-                print(f"Required tool not found: {e}")
-                print("\\nGenerated LaTeX code:")
-                print(quantikz_code)
\ No newline at end of file
+                f.write(header + "\\dump\n")
+            returncode = _run_quiet(
+                [_resolve_pdflatex(), '-ini', '-interaction=nonstopmode',
+                 f'-jobname={jobname}', '&pdflatex', tex_file], build_dir)
+            built = os.path.join(build_dir, jobname + ".fmt")
+            if returncode != 0 or not os.path.exists(built):
+                return None
+            os.replace(built, fmt_path + ".fmt")
+    except OSError:
+        return None
+    return fmt_path
+
+
+def _discard_format(border: str, fmt_path: str):
+    """Forget a format that failed to load and delete its file."""
+    with _format_lock:
+        if _FORMATS.get(border) == fmt_path:
+            del _FORMATS[border]
+        try:
+            os.remove(fmt_path + ".fmt")
+        except OSError:
+            pass
+
+
+def _run_quiet(cmd: List[str], cwd: str) -> int:
+    """Run a TeX command with its console output discarded.
+    
+    pdflatex writes everything it prints to the .log file as well, so
+    nothing is lost; on failure the log tail is read instead (_log_tail).
+    """
+    return subprocess.run(
+        cmd, cwd=cwd, stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    ).returncode
+
+
+def _log_tail(log_file: str, size: int = 1000) -> str:
+    """Last ``size`` characters of a TeX log, or an empty string if missing."""
+    try:
+        with open(log_file, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            f.seek(max(0, f.tell() - size))
+            return f.read().decode('utf-8', errors='replace')
+    except OSError:
+        return ""
+
+
+def _write_document(tex_file: str, header: Optional[str], quantikz_codes: List[str]):
+    """Write the document piece by piece rather than as one big string."""
+    with open(tex_file, 'w') as f:
+        if header is not None:
+            f.write(header)
+        f.write(_LATEX_BEGIN)
+        for i, code in enumerate(quantikz_codes):
+            if i:
+                f.write("\n\n")
+            f.write(code)
+        f.write(_LATEX_POSTAMBLE)
+
+
+# Compiled PDFs are kept across sessions, keyed by a hash of the document,
+# so re-running a notebook does not invoke pdflatex again. The oldest
+# entries (by last use) are dropped beyond _PDF_CACHE_MAX files.
+_PDF_CACHE_MAX = 256
+
+
+def _pdf_cache_path(header: str, quantikz_codes: List[str]) -> str:
+    """Cache file for the document made of ``header`` and ``quantikz_codes``."""
+    digest = hashlib.sha256(header.encode())
+    for code in quantikz_codes:
+        digest.update(b"\0")
+        digest.update(code.encode())
+    return os.path.join(_cache_dir("pdf"), digest.hexdigest() + ".pdf")
+
+
+def _pdf_cache_store(pdf_file: str, cache_file: str):
+    """Copy a compiled PDF into the cache and trim it; failures are ignored."""
+    import shutil
+    cache_dir = os.path.dirname(cache_file)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Copy under a private name first so concurrent readers never see
+        # a partial file
+        tmp_file = f"{cache_file}.{os.getpid()}.{threading.get_ident()}"
+        shutil.copyfile(pdf_file, tmp_file)
+        os.replace(tmp_file, cache_file)
+        
+        entries = [e for e in os.scandir(cache_dir) if e.name.endswith(".pdf")]
+        if len(entries) > _PDF_CACHE_MAX:
+            entries.sort(key=lambda e: e.stat().st_mtime)
+            for entry in entries[:len(entries) - _PDF_CACHE_MAX]:
+                os.remove(entry.path)
+    except OSError:
+        pass
+
+
+def _compile_pdf(quantikz_codes: List[str], border: str, tmpdir: str) -> str:
+    """Write the standalone document into ``tmpdir``, run pdflatex, return the PDF path.
+    
+    A document compiled before (in any session) is copied from the PDF
+    cache instead.
+    """
+    tex_file = os.path.join(tmpdir, "circuit.tex")
+    pdf_file = os.path.join(tmpdir, "circuit.pdf")
+    
+    cache_file = _pdf_cache_path(_LATEX_HEADER % border, quantikz_codes)
+    try:
+        import shutil
+        shutil.copyfile(cache_file, pdf_file)
+        os.utime(cache_file)  # Mark as recently used
+        return pdf_file
+    except OSError:
+        pass
+    
+    # Find pdflatex (cached after the first successful lookup)
+    pdflatex_cmd = _resolve_pdflatex()
+    
+    # Start from the precompiled header when available; the document then
+    # only carries the body
+    fmt = _preamble_format(border)
+    returncode = None
+    if fmt is not None:
+        _write_document(tex_file, None, quantikz_codes)
+        returncode = _run_quiet(
+            [pdflatex_cmd, f'-fmt={fmt}', '-interaction=nonstopmode', tex_file], tmpdir)
+    
+    # No format, or it failed to load: compile the full document
+    if returncode is None or returncode != 0:
+        _write_document(tex_file, _LATEX_HEADER % border, quantikz_codes)
+        full_returncode = _run_quiet(
+            [pdflatex_cmd, '-interaction=nonstopmode', tex_file], tmpdir)
+        # The document compiles on its own, so the format was at fault:
+        # drop it, and the next compile builds a fresh one
+        if returncode is not None and full_returncode == 0:
+            _discard_format(border, fmt)
+        returncode = full_returncode
+    
+    if returncode != 0:
+        print("LaTeX compilation failed:")
+        print(_log_tail(os.path.join(tmpdir, "circuit.log")))
+        raise RuntimeError("Failed to compile LaTeX")
+    
+    _pdf_cache_store(pdf_file, cache_file)
+    return pdf_file
+
+
+def _compile_pdf_bytes(quantikz_code: str, border: str) -> bytes:
+    """Compile one circuit in its own temporary directory and return the PDF."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with open(_compile_pdf([quantikz_code], border, tmpdir), 'rb') as f:
+            return f.read()
+
+
+def _display_pdf(pdf_file: str, n_pages: int, tmpdir: str):
+    """Show every page of a compiled PDF in Jupyter."""
+    # Try to display in Jupyter
+    try:
+        from IPython.display import Image, display
+        for png in _pdf_to_png(pdf_file, n_pages, tmpdir):
+            display(Image(png))
+    except Exception as e:
+        print(f"Could not display image: {e}")
+        print("Circuit PDF generated successfully.")
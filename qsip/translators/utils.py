@@ -2,6 +2,17 @@
 
 import os
 import platform
+import shutil
+from typing import Optional
+
+# Set once setup_latex_path has run; PATH only needs extending once
+_LATEX_PATH_SETUP_DONE = False
+
+# Resolved pdflatex command, cached after the first successful lookup
+_PDFLATEX_CMD: Optional[str] = None
+
+# Install locations tried when pdflatex is not on PATH
+_PDFLATEX_CANDIDATES = ('/Library/TeX/texbin/pdflatex', '/usr/local/bin/pdflatex')
 
 
 def setup_latex_path():
@@ -11,6 +22,11 @@ def setup_latex_path():
     This function should be called before using print_qtz with latex=False
     if you're having trouble with pdflatex not being found.
     """
+    global _LATEX_PATH_SETUP_DONE
+    if _LATEX_PATH_SETUP_DONE:
+        return
+    _LATEX_PATH_SETUP_DONE = True
+    
     if platform.system() == 'Darwin':  # macOS
         # Common LaTeX installation paths on macOS
         latex_paths = [
@@ -42,6 +58,25 @@ def setup_latex_path():
                 break
 
 
+def _resolve_pdflatex() -> str:
+    """Return the pdflatex command to run, looking it up only once.
+    
+    Uses PATH first, then the usual macOS/Homebrew install locations. A
+    failed lookup is not cached, so a later PATH fix is picked up.
+    """
+    global _PDFLATEX_CMD
+    if _PDFLATEX_CMD is not None:
+        return _PDFLATEX_CMD
+    
+    # shutil.which walks PATH in-process, no `which` subprocess needed
+    found = shutil.which('pdflatex') or next(
+        (p for p in _PDFLATEX_CANDIDATES if os.path.exists(p)), None)
+    if found is None:
+        return 'pdflatex'
+    _PDFLATEX_CMD = found
+    return found
+
+
 def check_latex_installation():
     """Check if LaTeX is properly installed and accessible."""
     import subprocess
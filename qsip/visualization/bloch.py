@@ -1,20 +1,33 @@
 __all__ = ['Bloch', 'QuantumState']
 
+import copy
 import os
+import re
+from collections import namedtuple
+from functools import lru_cache
 from typing import Literal, Union, List, Tuple
 import numpy as np
 from numpy import cos, ones, outer, sin
-from packaging.version import parse as parse_version
+
+# Shared read-only Pauli matrices for internal use, so hot paths don't
+# allocate a fresh 2x2 array on every call.
+from qsip.gates import X as _PX, Y as _PY, Z as _PZ
 
 try:
     import matplotlib
     import matplotlib.pyplot as plt
-    from matplotlib.patches import FancyArrowPatch
+    from matplotlib.patches import ArrowStyle, FancyArrowPatch
     from mpl_toolkits.mplot3d import Axes3D, proj3d
 
+    # (major, minor) of matplotlib, read once at import
+    _MPL_VERSION = tuple(int(n) for n in re.match(r'(\d+)\.(\d+)', matplotlib.__version__).groups())
+
+    # set_box_aspect is new for matplotlib>=3.3
+    _MPL_HAS_BOX_ASPECT = _MPL_VERSION >= (3, 3)
+
     # Define a custom _axes3D function based on the matplotlib version.
     # The auto_add_to_figure keyword is new for matplotlib>=3.4.
-    if parse_version(matplotlib.__version__) >= parse_version('3.4'):
+    if _MPL_VERSION >= (3, 4):
         def _axes3D(fig, *args, **kwargs):
             ax = Axes3D(fig, *args, auto_add_to_figure=False, **kwargs)
             return fig.add_axes(ax)
@@ -38,7 +51,56 @@ try:
             xs3d, ys3d, zs3d = self._verts3d
             xs, ys, zs = proj3d.proj_transform(xs3d, ys3d, zs3d, self.axes.M)
             self.set_positions((xs[0], ys[0]), (xs[1], ys[1]))
-            return np.min(zs)
+            # A plain comparison; np.min is a full reduction for two values
+            return float(zs[0]) if zs[0] < zs[1] else float(zs[1])
+
+    class _Arrow3DGroup:
+        """Endpoints of several 3D arrows, projected together once per draw.
+        
+        ``endpoints`` has shape ``(n, 2, 3)``: the tail and head of each
+        arrow. Axes3D builds a new projection matrix for every draw, so the
+        result of one ``proj_transform`` call is reused while ``M`` is the
+        same object.
+        """
+
+        def __init__(self, endpoints):
+            self._verts3d = np.asarray(endpoints, dtype=float).reshape(-1, 3).T
+            self._M = None
+            self._projected = None
+
+        def project(self, M):
+            """Projected ``(xs, ys)`` of all endpoints and each arrow's nearest depth."""
+            if M is not self._M:
+                xs, ys, zs = proj3d.proj_transform(*self._verts3d, M)
+                self._projected = xs, ys, np.minimum(zs[0::2], zs[1::2]).tolist()
+                self._M = M
+            return self._projected
+
+    class GroupedArrow3D(FancyArrowPatch):
+        """Arrow ``index`` of an ``_Arrow3DGroup``.
+        
+        Each arrow stays its own artist, so Axes3D still depth-sorts it
+        against the sphere surfaces, but the projection is shared.
+        """
+
+        def __init__(self, group, index, *args, **kwargs):
+            FancyArrowPatch.__init__(self, (0, 0), (0, 0), *args, **kwargs)
+            self._group = group
+            self._index = index
+
+        def _project(self):
+            xs, ys, zmin = self._group.project(self.axes.M)
+            i = 2 * self._index
+            self.set_positions((xs[i], ys[i]), (xs[i + 1], ys[i + 1]))
+            return zmin[self._index]
+
+        def draw(self, renderer):
+            self._project()
+            FancyArrowPatch.draw(self, renderer)
+
+        def do_3d_projection(self, renderer=None):
+            # only called by matplotlib >= 3.5
+            return self._project()
 except ImportError:
     pass
 
@@ -63,27 +125,51 @@ class QuantumState:
             Density matrix representation of the quantum state
         """
         if state_vector is not None:
-            self.state_vector = np.asarray(state_vector, dtype=complex)
+            # Own copy, so normalizing never aliases the caller's array
+            self.state_vector = np.array(state_vector, dtype=complex)
             self.is_pure = True
-            # Normalize the state vector
-            norm = np.linalg.norm(self.state_vector)
-            if norm > 0:
-                self.state_vector = self.state_vector / norm
-            # Create density matrix from state vector
-            self.density_matrix = np.outer(self.state_vector, np.conj(self.state_vector))
+            # Normalize the state vector; textbook states usually already
+            # are, which the squared norm tells without a sqrt
+            sq_norm = np.vdot(self.state_vector, self.state_vector).real
+            if sq_norm > 0 and abs(sq_norm - 1.0) > 1e-12:
+                self.state_vector /= np.sqrt(sq_norm)
+            # The density matrix is built on first access
+            self._density_matrix = None
         elif density_matrix is not None:
-            self.density_matrix = np.asarray(density_matrix, dtype=complex)
-            self.is_pure = np.allclose(np.trace(self.density_matrix @ self.density_matrix), 1.0)
+            self._density_matrix = np.asarray(density_matrix, dtype=complex)
+            # Tr(rho^2) = sum_ij rho_ij rho_ji, without forming rho @ rho;
+            # compared with np.allclose's default tolerances
+            purity = np.einsum('ij,ji->', self._density_matrix, self._density_matrix)
+            self.is_pure = bool(abs(purity - 1.0) <= 1e-8 + 1e-5)
             self.state_vector = None
         else:
             raise ValueError("Must provide either state_vector or density_matrix")
     
+    @property
+    def density_matrix(self) -> np.ndarray:
+        """Density matrix of the state, computed from the state vector if needed."""
+        if self._density_matrix is None:
+            self._density_matrix = np.outer(self.state_vector, np.conj(self.state_vector))
+        return self._density_matrix
+    
+    @density_matrix.setter
+    def density_matrix(self, value: np.ndarray):
+        self._density_matrix = value
+    
     def expectation(self, operator: np.ndarray) -> float:
         """Calculate expectation value of an operator."""
         if self.is_pure and self.state_vector is not None:
-            return np.real(np.conj(self.state_vector) @ operator @ self.state_vector)
+            return np.real(np.vdot(self.state_vector, operator @ self.state_vector))
         else:
             return np.real(np.trace(operator @ self.density_matrix))
+    
+    def to_bloch_vector(self) -> np.ndarray:
+        """Bloch vector ``(<X>, <Y>, <Z>)`` of the state.
+        
+        Uses the closed forms for qubit states instead of three separate
+        ``expectation`` calls.
+        """
+        return np.array(_quantum_state_to_bloch(self), dtype=float)
 
 
 # Pauli matrices
@@ -102,29 +188,167 @@ def pauli_z():
     return np.array([[1, 0], [0, -1]], dtype=complex)
 
 
+def _amplitudes_to_bloch(a: complex, b: complex) -> List[float]:
+    """Bloch vector of the normalized qubit state ``a|0> + b|1>``."""
+    # Closed forms of <X>, <Y>, <Z>, instead of three Pauli products
+    ab = a.conjugate() * b
+    return [2 * ab.real, 2 * ab.imag, abs(a) ** 2 - abs(b) ** 2]
+
+
+def _density_to_bloch(rho: np.ndarray) -> List[float]:
+    """Bloch vector ``Re Tr(P rho)`` of a 2x2 density matrix."""
+    return [(rho[0, 1] + rho[1, 0]).real,
+            (rho[1, 0] - rho[0, 1]).imag,
+            (rho[0, 0] - rho[1, 1]).real]
+
+
+def _quantum_state_to_bloch(state: QuantumState) -> List[float]:
+    """Bloch vector of a QuantumState."""
+    if state.is_pure and state.state_vector is not None and state.state_vector.shape == (2,):
+        return _amplitudes_to_bloch(*state.state_vector)
+    if state.density_matrix.shape == (2, 2):
+        return _density_to_bloch(state.density_matrix)
+    return [state.expectation(_PX), state.expectation(_PY), state.expectation(_PZ)]
+
+
+def _vector_to_bloch(vector: np.ndarray) -> List[float]:
+    """Bloch vector of a (possibly unnormalized) state vector."""
+    if vector.shape != (2,):
+        return _quantum_state_to_bloch(QuantumState(state_vector=vector))
+    # Normalized as QuantumState would, without building its density matrix
+    vector = np.asarray(vector, dtype=complex)
+    norm = np.linalg.norm(vector)
+    if norm > 0:
+        vector = vector / norm
+    return _amplitudes_to_bloch(*vector)
+
+
+def _matrix_to_bloch(matrix: np.ndarray) -> List[float]:
+    """Bloch vector of a density matrix."""
+    if matrix.shape != (2, 2):
+        return _quantum_state_to_bloch(QuantumState(density_matrix=matrix))
+    # QuantumState's purity check is not needed for the coordinates
+    return _density_to_bloch(np.asarray(matrix, dtype=complex))
+
+
+def _ndarray_to_bloch(array: np.ndarray) -> List[float]:
+    """Bloch vector of a coordinate array, state vector or density matrix."""
+    if array.shape == (3,):
+        # Already a Bloch vector
+        return list(array)
+    # A 1-D array is a state vector, anything else a density matrix
+    return _vector_to_bloch(array) if array.ndim == 1 else _matrix_to_bloch(array)
+
+
+# Converters keyed by the exact input type; subclasses fall back to an
+# isinstance scan over the same table
+_BLOCH_CONVERTERS = {
+    list: list,  # Already in Cartesian coordinates
+    tuple: list,
+    np.ndarray: _ndarray_to_bloch,
+    QuantumState: _quantum_state_to_bloch,
+}
+
+
 def _state_to_cartesian_coordinates(state: Union[QuantumState, np.ndarray, list, tuple]) -> List[float]:
     """Convert a quantum state to Bloch sphere coordinates."""
-    if isinstance(state, (list, tuple)):
-        # Already in Cartesian coordinates
-        return list(state)
-    elif isinstance(state, np.ndarray):
-        if state.shape == (3,):
-            # Already a Bloch vector
-            return list(state)
-        else:
-            # Convert numpy array to QuantumState
-            if state.ndim == 1:
-                state = QuantumState(state_vector=state)
-            else:
-                state = QuantumState(density_matrix=state)
+    convert = _BLOCH_CONVERTERS.get(type(state))
+    if convert is None:
+        convert = next((f for t, f in _BLOCH_CONVERTERS.items() if isinstance(state, t)), None)
+        if convert is None:
+            raise ValueError("Invalid state type")
+    return convert(state)
+
+
+def _states_to_cartesian_coordinates(states: List) -> np.ndarray:
+    """Bloch coordinates of several states as an ``(n, 3)`` array.
     
-    if isinstance(state, QuantumState):
-        x = state.expectation(pauli_x())
-        y = state.expectation(pauli_y())
-        z = state.expectation(pauli_z())
-        return [x, y, z]
+    A batch made only of qubit state vectors (arrays or pure QuantumStates)
+    is stacked into one ``(n, 2)`` amplitude array and converted with array
+    operations over the whole batch; anything else goes state by state.
+    """
+    amps = []
+    for st in states:
+        if type(st) is QuantumState and st.is_pure and st.state_vector is not None:
+            st = st.state_vector
+        elif type(st) is not np.ndarray:
+            break
+        if st.shape != (2,):
+            break
+        amps.append(st)
     else:
-        raise ValueError("Invalid state type")
+        return _amplitude_array_to_bloch(np.array(amps, dtype=complex))
+    return np.array([_state_to_cartesian_coordinates(st) for st in states])
+
+
+def _amplitude_array_to_bloch(amps: np.ndarray) -> np.ndarray:
+    """Bloch coordinates ``(n, 3)`` of an ``(n, 2)`` complex amplitude array.
+    
+    Rows are normalized in place; zero rows stay at the origin.
+    """
+    norms = np.linalg.norm(amps, axis=1, keepdims=True)
+    np.divide(amps, norms, out=amps, where=norms > 0)
+    a, b = amps[:, 0], amps[:, 1]
+    ab = a.conjugate() * b
+    return np.column_stack((2 * ab.real, 2 * ab.imag, abs(a) ** 2 - abs(b) ** 2))
+
+
+def _same_state(a, b) -> bool:
+    """Compare render snapshots, treating numpy arrays by value."""
+    if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+        return (isinstance(a, np.ndarray) and isinstance(b, np.ndarray)
+                and a.shape == b.shape and np.array_equal(a, b))
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, dict):
+        return a.keys() == b.keys() and all(_same_state(a[k], b[k]) for k in a)
+    if isinstance(a, (list, tuple)):
+        return len(a) == len(b) and all(_same_state(x, y) for x, y in zip(a, b))
+    try:
+        return bool(a == b)
+    except (TypeError, ValueError):
+        return False
+
+
+# What a render put on its axes: the snapshot of the scene and vectors drawn
+_DrawnScene = namedtuple('_DrawnScene', ['axes', 'scene', 'n_vectors', 'vectors',
+                                         'after_vectors'])
+
+
+@lru_cache(maxsize=None)
+def _sphere_half(front: bool, resolution: int = 50):
+    """Surface grid and wireframe arcs for the front or back half of the sphere.
+    
+    The geometry never changes, so it is built once and shared by every
+    render (and every frame of an animation). Returns ``((x, y, z), lines)``
+    where ``lines`` has shape ``(n_lines, 3, 30)`` (coordinate, then point
+    along the arc): the 4 latitude arcs
+    followed by the 6 longitude arcs. The arrays are read-only.
+    """
+    u_start, u_stop = (-np.pi, 0) if front else (0, np.pi)
+    
+    # Surface grid, resolution x resolution points
+    u_surf = np.linspace(u_start, u_stop, resolution)
+    v_surf = np.linspace(0, np.pi, resolution)
+    x_surf = outer(cos(u_surf), sin(v_surf))
+    y_surf = outer(sin(u_surf), sin(v_surf))
+    z_surf = outer(ones(np.size(u_surf)), cos(v_surf))
+    
+    # Wireframe with smooth arcs: few grid lines, many points per line
+    u_grid = np.linspace(u_start, u_stop, 6)  # 6 longitude lines
+    v_grid = np.linspace(0, np.pi, 6)  # 4 latitude lines (poles skipped)
+    u_smooth = np.linspace(u_start, u_stop, 30)
+    v_smooth = np.linspace(0, np.pi, 30)
+    
+    lat = [(cos(u_smooth) * sin(v), sin(u_smooth) * sin(v), ones(len(u_smooth)) * cos(v))
+           for v in v_grid[1:-1]]
+    lon = [(cos(u) * sin(v_smooth), sin(u) * sin(v_smooth), cos(v_smooth))
+           for u in u_grid]
+    lines = np.array(lat + lon)
+    
+    for arr in (x_surf, y_surf, z_surf, lines):
+        arr.flags.writeable = False
+    return (x_surf, y_surf, z_surf), lines
 
 
 class Bloch:
@@ -158,6 +382,8 @@ class Bloch:
         Transparency of Bloch sphere itself.
     sphere_color : str, default '#FFDDDD'
         Color of Bloch sphere.
+    sphere_resolution : int, default 30
+        Number of grid points along each direction of a hemisphere surface.
     figsize : list, default [7, 7]
         Figure size of Bloch sphere plot.
     vector_color : list, ["g", "#CC6600", "b", "r"]
@@ -201,6 +427,7 @@ class Bloch:
         # Warmer, creamier white sphere
         self.sphere_color = '#FFFAF0'  # Floral white - creamier, warmer tone
         self.sphere_alpha = 0.4  # More opaque for richer cream appearance
+        self.sphere_resolution = 30  # Surface grid points per direction of each hemisphere
         self.frame_color = '#8B7355'  # Warm brown for frame
         self.frame_width = 0.8  # Thinner frame lines
         self.frame_alpha = 0.2  # More subtle frame
@@ -257,6 +484,9 @@ class Bloch:
         self.point_alpha = []
         self._lines = []
         self._arcs = []
+        
+        # What the last render drew, for incremental re-renders
+        self._drawn = None
 
     def set_label_convention(self, convention):
         """Set x, y and z labels according to one of conventions.
@@ -343,19 +573,30 @@ class Bloch:
         s += "zlpos:           " + str(self.zlpos) + "\n"
         return s
 
-    def _repr_png_(self):
+    # Rich display formats, as (MIME type, print_figure format)
+    _REPR_FORMATS = (('image/png', 'png'), ('image/svg+xml', 'svg'))
+
+    def _repr_figure(self, formats):
+        """Render once and return the figure in each requested format."""
         from IPython.core.pylabtools import print_figure
         self.render()
-        fig_data = print_figure(self.fig, 'png')
+        data = {mime: print_figure(self.fig, fmt) for mime, fmt in formats}
         plt.close(self.fig)
-        return fig_data
+        return data
+
+    def _repr_mimebundle_(self, include=None, exclude=None):
+        # IPython asks for every rich format at display time; answering
+        # them together renders the sphere once instead of once per format
+        formats = [(mime, fmt) for mime, fmt in self._REPR_FORMATS
+                   if (include is None or mime in include)
+                   and (exclude is None or mime not in exclude)]
+        return self._repr_figure(formats)
+
+    def _repr_png_(self):
+        return self._repr_figure(self._REPR_FORMATS[:1])['image/png']
 
     def _repr_svg_(self):
-        from IPython.core.pylabtools import print_figure
-        self.render()
-        fig_data = print_figure(self.fig, 'svg')
-        plt.close(self.fig)
-        return fig_data
+        return self._repr_figure(self._REPR_FORMATS[1:])['image/svg+xml']
 
     def clear(self):
         """Resets Bloch sphere data sets to empty."""
@@ -367,6 +608,7 @@ class Bloch:
         self.annotations = []
         self.vector_color = []
         self.point_color = None
+        self._inner_point_color = []
         self._lines = []
         self._arcs = []
 
@@ -398,7 +640,8 @@ class Bloch:
             raise ValueError(f"Invalid method: {meth}")
 
         if meth == 's' and points.shape[1] == 1:
-            points = np.append(points[:, :1], points, axis=1)
+            # Duplicate the single column directly into a (3, 2) array
+            points = np.repeat(points, 2, axis=1)
 
         self.point_style.append(meth)
         self.points.append(points)
@@ -431,15 +674,44 @@ class Bloch:
         else:
             colors = [None] * len(state)
 
-        for k, st in enumerate(state):
-            vec = _state_to_cartesian_coordinates(st)
-            
-            if kind == 'vector':
-                self.add_vectors([vec], colors=[colors[k]], alpha=alpha)
-            elif kind == 'point':
+        if not state:
+            return
+        if kind not in ('vector', 'point'):
+            raise ValueError(f"Invalid kind: {kind}")
+        
+        # Convert every state in one go
+        vecs = _states_to_cartesian_coordinates(state)
+        
+        if kind == 'vector':
+            self.add_vectors(vecs, colors=colors, alpha=alpha)
+        else:
+            for k, vec in enumerate(vecs):
                 self.add_points(vec, colors=[colors[k]], alpha=alpha)
-            else:
-                raise ValueError(f"Invalid kind: {kind}")
+
+    def add_states_bulk(self, states, meth: Literal['s', 'm', 'l'] = 'l',
+                        colors=None, alpha=1.0):
+        """Add many qubit state vectors to the Bloch sphere as one point set.
+
+        Parameters
+        ----------
+        states : array_like
+            Array of shape (n, 2) with the amplitudes of each state, e.g. the
+            samples of a trajectory. Rows need not be normalized.
+        meth : {'s', 'm', 'l'}, default='l'
+            Type of points to plot, as in :meth:`add_points`.
+        colors : array_like
+            Optional colors for the points.
+        alpha : float, default=1.
+            Transparency value for the points.
+        """
+        amps = np.array(states, dtype=complex)
+
+        if amps.ndim != 2 or amps.shape[1] != 2:
+            raise ValueError("States must be a 2D array with shape (n, 2)")
+
+        # All Bloch vectors from one set of array operations
+        self.add_points(_amplitude_array_to_bloch(amps).T, meth=meth,
+                        colors=colors, alpha=alpha)
 
     def add_vectors(self, vectors, colors=None, alpha=1.0):
         """Add vectors to Bloch sphere.
@@ -468,10 +740,11 @@ class Bloch:
             if colors.ndim == 0:
                 colors = np.repeat(colors, vectors.shape[0])
 
-        for k, vec in enumerate(vectors):
-            self.vectors.append(vec)
-            self.vector_alpha.append(alpha)
-            self.vector_color.append(colors[k])
+        # Extend the per-vector lists in bulk rather than appending per row
+        n = vectors.shape[0]
+        self.vectors.extend(vectors)
+        self.vector_alpha.extend([alpha] * n)
+        self.vector_color.extend([colors[k] for k in range(n)])
 
     def add_annotation(self, state_or_vector, text, **kwargs):
         """Add text annotation to Bloch sphere.
@@ -529,6 +802,50 @@ class Bloch:
             'opts': kwargs
         })
 
+    def add_annotations_smart(self, states_or_vectors, texts, offset=0.3, **kwargs):
+        """Add several smart-positioned text annotations at once.
+
+        Batched version of :meth:`add_annotation_smart`; the offsets for all
+        positions are computed in one vectorized pass.
+
+        Parameters
+        ----------
+        states_or_vectors : array_like or list
+            Either an ``(n, 3)`` array of Bloch vectors, or a list of
+            QuantumState/array/list/tuple positions.
+        texts : list of str
+            Annotation texts, one per position (can use LaTeX).
+        offset : float
+            Distance to offset each text from its point.
+        kwargs :
+            Options for matplotlib text, shared by all annotations.
+        """
+        if (isinstance(states_or_vectors, np.ndarray)
+                and states_or_vectors.ndim == 2
+                and states_or_vectors.shape[1] == 3):
+            vecs = states_or_vectors.astype(float)
+        else:
+            vecs = np.array([_state_to_cartesian_coordinates(s)
+                             for s in states_or_vectors], dtype=float)
+
+        if len(vecs) != len(texts):
+            raise ValueError("Need exactly one text per annotation position")
+
+        # Push each text out along its vector; center points go upward
+        norms = np.linalg.norm(vecs, axis=1, keepdims=True)
+        centered = norms[:, 0] == 0
+        directions = np.divide(vecs, norms, out=np.zeros_like(vecs),
+                               where=~centered[:, np.newaxis])
+        directions[centered, 2] = 1.0
+        positions = vecs + offset * directions
+
+        for position, text in zip(positions, texts):
+            self.annotations.append({
+                'position': position,
+                'text': text,
+                'opts': kwargs
+            })
+
     def add_arc(self, start, end, fmt="b", steps=None, **kwargs):
         """Add an arc between two points on the sphere.
 
@@ -549,25 +866,28 @@ class Bloch:
         pt1 = np.asarray(pt1)
         pt2 = np.asarray(pt2)
 
-        len1 = np.linalg.norm(pt1)
-        len2 = np.linalg.norm(pt2)
+        # Both radii and the distances used below, in one norm call
+        len1, len2, dist, sum_norm = np.linalg.norm(
+            np.array([pt1, pt2, pt1 - pt2, pt1 + pt2], dtype=float), axis=1)
 
         # Validation
         if len1 < 1e-12 or len2 < 1e-12:
             raise ValueError("Points too close to origin")
         elif abs(len1 - len2) > 1e-12:
             raise ValueError("Points not on same sphere")
-        elif np.linalg.norm(pt1 - pt2) < 1e-12:
+        elif dist < 1e-12:
             raise ValueError("Points are identical")
-        elif np.linalg.norm(pt1 + pt2) < 1e-12:
+        elif sum_norm < 1e-12:
             raise ValueError("Points are antipodal")
 
         if steps is None:
-            steps = max(2, int(np.linalg.norm(pt1 - pt2) * 100))
+            steps = max(2, int(dist * 100))
 
         t = np.linspace(0, 1, steps)
         line = pt1[:, np.newaxis] * t + pt2[:, np.newaxis] * (1 - t)
-        arc = (line * len1 / np.linalg.norm(line, axis=0)).T
+        # Rescale each column onto the sphere; einsum gives the column
+        # norms without a squared temporary
+        arc = (line * (len1 / np.sqrt(np.einsum('ij,ij->j', line, line)))).T
 
         # Handle visibility regions
         if len1 < 1 - 1e-12:
@@ -581,31 +901,31 @@ class Bloch:
                 return "rear"
             return "inner"
 
-        def append_interpolation_point(point, part, norm: float):
-            if point[0] != 0:
-                t_edge = 1 / (1 - part[-1][0] / point[0])
-                edge_point = part[-1] * t_edge + point * (1 - t_edge)
-                edge_point = edge_point * norm / np.linalg.norm(edge_point)
-                part.append(edge_point)
-                return [edge_point, point]
-            else:
-                part.append(point)
-                return [point]
-
-        front = arc[0][0] >= 0
-        part = []
+        # Split the arc wherever it crosses the x = 0 plane, found for all
+        # points at once rather than point by point
+        front = arc[:, 0] >= 0
+        splits = np.flatnonzero(front[1:] != front[:-1]) + 1
         
-        for point in arc:
-            if (point[0] >= 0) == front:
-                part.append(point)
-                continue
-
-            new_part = append_interpolation_point(point, part, len1)
-            self._arcs.append([np.array(part), get_plot_area(front, len1), fmt, kwargs])
-            part = new_part
-            front = not front
-
-        self._arcs.append([np.array(part), get_plot_area(front, len1), fmt, kwargs])
+        # Interpolate the edge point on the plane for every crossing; a
+        # point lying exactly on the plane is its own edge point
+        prev, cur = arc[splits - 1], arc[splits]
+        on_plane = cur[:, 0] == 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t_edge = 1 / (1 - prev[:, 0] / cur[:, 0])
+        edges = prev * t_edge[:, np.newaxis] + cur * (1 - t_edge[:, np.newaxis])
+        edges = edges * len1 / np.linalg.norm(edges, axis=1, keepdims=True)
+        edges[on_plane] = cur[on_plane]
+        
+        # Each part ends on the edge point of its crossing; a part that
+        # starts at an interpolated edge point also begins with it
+        bounds = np.concatenate(([0], splits, [len(arc)]))
+        for k in range(len(bounds) - 1):
+            part = arc[bounds[k]:bounds[k + 1]]
+            if k > 0 and not on_plane[k - 1]:
+                part = np.concatenate((edges[k - 1:k], part))
+            if k < len(splits):
+                part = np.concatenate((part, edges[k:k + 1]))
+            self._arcs.append([part, get_plot_area(front[bounds[k]], len1), fmt, kwargs])
 
     def add_line(self, start, end, fmt="k", **kwargs):
         """Add a line segment between two points.
@@ -632,11 +952,14 @@ class Bloch:
 
     def render(self):
         """Render the Bloch sphere and its data."""
-        # Configure matplotlib for better math rendering
-        import matplotlib
-        matplotlib.rcParams['mathtext.fontset'] = self.mathtext_fontset
-        matplotlib.rcParams['font.family'] = self.font_family
-        
+        # Fonts for better math rendering, scoped to this render instead of
+        # changing the global rcParams. Text artists keep the fonts they
+        # were created with, so later redraws and savefig match.
+        with matplotlib.rc_context({'mathtext.fontset': self.mathtext_fontset,
+                                    'font.family': self.font_family}):
+            self._render()
+
+    def _render(self):
         if not self._ext_fig and not self._is_inline_backend():
             if self.fig is not None and not plt.fignum_exists(self.fig.number):
                 self.fig = None
@@ -650,6 +973,28 @@ class Bloch:
         if self.axes is None:
             self.axes = _axes3D(self.fig, azim=self.view[0], elev=self.view[1])
 
+        # When only vectors were added since the last render on these axes,
+        # keep the sphere and everything else and just add their arrows.
+        # Artists with equal depth are drawn in insertion order, so the ones
+        # plotted after the vectors are taken out and put back behind the
+        # new arrows, as a full render would order them.
+        scene = self._scene_state()
+        drawn = self._drawn
+        if (drawn is not None and drawn.axes is self.axes
+                and len(self.vectors) >= drawn.n_vectors
+                and _same_state(scene, drawn.scene)
+                and _same_state(self._vector_state(drawn.n_vectors), drawn.vectors)):
+            for artist in drawn.after_vectors:
+                artist.remove()
+            self.plot_vectors(start=drawn.n_vectors)
+            for artist in drawn.after_vectors:
+                self.axes.add_artist(artist)
+            self._drawn = drawn._replace(n_vectors=len(self.vectors),
+                                         vectors=self._vector_state(len(self.vectors)))
+            self.fig.canvas.draw()
+            return
+        self._drawn = None
+
         self.axes.clear()
         self.axes.grid(False)
         
@@ -663,13 +1008,14 @@ class Bloch:
             self.axes.set_ylim3d(-1.0, 1.0)
             self.axes.set_zlim3d(-1.0, 1.0)
             
-        if parse_version(matplotlib.__version__) >= parse_version('3.3'):
+        if _MPL_HAS_BOX_ASPECT:
             self.axes.set_box_aspect((1, 1, 1))
 
         self.plot_arcs("rear")
         self.plot_back()
         self.plot_points()
         self.plot_vectors()
+        before_tail = set(map(id, self.axes.get_children()))
         self.plot_lines()
         self.plot_arcs("inner")
         if not self.background:
@@ -678,86 +1024,47 @@ class Bloch:
         self.plot_arcs("front")
         self.plot_axes_labels()
         self.plot_annotations()
+        after_vectors = [a for a in self.axes.get_children() if id(a) not in before_tail]
+        self._drawn = _DrawnScene(self.axes, scene, len(self.vectors),
+                                  self._vector_state(len(self.vectors)), after_vectors)
         self.fig.canvas.draw()
 
+    # Attributes that do not change what render() draws besides the vectors
+    _SCENE_EXCLUDE = frozenset({'fig', 'axes', '_ext_fig', 'savenum', '_drawn',
+                                'vectors', 'vector_alpha', 'vector_color'})
+
+    def _scene_state(self):
+        """Snapshot of every setting and data set render() draws, except vectors."""
+        return copy.deepcopy({k: v for k, v in vars(self).items()
+                              if k not in self._SCENE_EXCLUDE})
+
+    def _vector_state(self, n):
+        """Snapshot of the first ``n`` vectors with their alphas and colors."""
+        return copy.deepcopy((self.vectors[:n], self.vector_alpha[:n], self.vector_color[:n]))
+
     def plot_back(self):
         """Plot back half of sphere."""
-        # High resolution for smooth sphere surface
-        u_surf = np.linspace(0, np.pi, 50)
-        v_surf = np.linspace(0, np.pi, 50)
-        x_surf = outer(cos(u_surf), sin(v_surf))
-        y_surf = outer(sin(u_surf), sin(v_surf))
-        z_surf = outer(ones(np.size(u_surf)), cos(v_surf))
-        
-        # Plot smooth surface
-        self.axes.plot_surface(x_surf, y_surf, z_surf, rstride=1, cstride=1,
-                               color=self.sphere_color, linewidth=0,
-                               alpha=self.sphere_alpha, antialiased=True)
-        
-        # Create wireframe with smooth arcs
-        # Use more points for drawing smooth curves, but fewer grid lines
-        u_grid = np.linspace(0, np.pi, 6)  # 5 longitude lines  
-        v_grid = np.linspace(0, np.pi, 6)  # 5 latitude lines
-        
-        # High resolution for smooth arc drawing
-        u_smooth = np.linspace(0, np.pi, 30)
-        v_smooth = np.linspace(0, np.pi, 30)
-        
-        # Plot smooth latitude lines (circles)
-        for i in range(1, len(v_grid)-1):  # Skip poles
-            x_lat = cos(u_smooth) * sin(v_grid[i])
-            y_lat = sin(u_smooth) * sin(v_grid[i])
-            z_lat = ones(len(u_smooth)) * cos(v_grid[i])
-            self.axes.plot(x_lat, y_lat, z_lat, 
-                          color=self.frame_color, alpha=self.frame_alpha,
-                          linewidth=self.frame_width)
-        
-        # Plot smooth longitude lines (meridians)
-        for i in range(len(u_grid)):
-            x_lon = cos(u_grid[i]) * sin(v_smooth)
-            y_lon = sin(u_grid[i]) * sin(v_smooth)
-            z_lon = cos(v_smooth)
-            self.axes.plot(x_lon, y_lon, z_lon,
-                          color=self.frame_color, alpha=self.frame_alpha,
-                          linewidth=self.frame_width)
+        self._plot_sphere_half(front=False)
 
     def plot_front(self):
         """Plot front half of sphere."""
-        # High resolution for smooth sphere surface
-        u_surf = np.linspace(-np.pi, 0, 50)
-        v_surf = np.linspace(0, np.pi, 50)
-        x_surf = outer(cos(u_surf), sin(v_surf))
-        y_surf = outer(sin(u_surf), sin(v_surf))
-        z_surf = outer(ones(np.size(u_surf)), cos(v_surf))
+        self._plot_sphere_half(front=True)
+
+    def _plot_sphere_half(self, front: bool):
+        """Plot one half of the sphere surface and its wireframe."""
+        surface, wireframe = _sphere_half(front, self.sphere_resolution)
         
-        # Plot smooth surface
-        self.axes.plot_surface(x_surf, y_surf, z_surf, rstride=1, cstride=1,
+        # Plot smooth surface; antialiasing stays on, since without it the
+        # seams between translucent facets show as a grid
+        self.axes.plot_surface(*surface, rstride=1, cstride=1,
                                color=self.sphere_color, linewidth=0,
                                alpha=self.sphere_alpha, antialiased=True)
         
-        # Create wireframe with smooth arcs (front half)
-        u_grid = np.linspace(-np.pi, 0, 6)  # 5 longitude lines
-        v_grid = np.linspace(0, np.pi, 6)  # 5 latitude lines
-        
-        # High resolution for smooth arc drawing
-        u_smooth = np.linspace(-np.pi, 0, 30)
-        v_smooth = np.linspace(0, np.pi, 30)
-        
-        # Plot smooth latitude lines (front semicircles)
-        for i in range(1, len(v_grid)-1):  # Skip poles
-            x_lat = cos(u_smooth) * sin(v_grid[i])
-            y_lat = sin(u_smooth) * sin(v_grid[i])
-            z_lat = ones(len(u_smooth)) * cos(v_grid[i])
-            self.axes.plot(x_lat, y_lat, z_lat,
-                          color=self.frame_color, alpha=self.frame_alpha,
-                          linewidth=self.frame_width)
-        
-        # Plot smooth longitude lines (front meridians)
-        for i in range(len(u_grid)):
-            x_lon = cos(u_grid[i]) * sin(v_smooth)
-            y_lon = sin(u_grid[i]) * sin(v_smooth)
-            z_lon = cos(v_smooth)
-            self.axes.plot(x_lon, y_lon, z_lon,
+        # Latitude circles, then longitude meridians. These stay Line3D
+        # artists: Axes3D does not depth-sort lines, while a collection
+        # would join the sort and push front arrows under the surface.
+        for x_line, y_line, z_line in wireframe:
+            self.axes.plot(x_line, y_line, z_line,
                           color=self.frame_color, alpha=self.frame_alpha,
                           linewidth=self.frame_width)
 
@@ -774,6 +1081,10 @@ class Bloch:
                        lw=self.frame_width * 0.8, color=self.frame_color,
                        alpha=self.frame_alpha * 0.8)
 
+    # Background box behind the axis labels; Text.set_bbox copies it
+    _LABEL_BBOX = {'boxstyle': 'round,pad=0.3', 'facecolor': 'white',
+                   'edgecolor': 'none', 'alpha': 0.7}
+
     def plot_axes_labels(self):
         """Plot axis labels."""
         if not self.show_axis_labels:
@@ -785,54 +1096,55 @@ class Bloch:
             'horizontalalignment': 'center',
             'verticalalignment': 'center',
             'fontfamily': self.font_family,
-            'bbox': dict(boxstyle='round,pad=0.3', facecolor='white', 
-                        edgecolor='none', alpha=0.7)  # Add background box
+            'bbox': self._LABEL_BBOX,  # Add background box
         }
         
-        if self.xlabel[0]:  # Only show if not empty
-            self.axes.text(0, -self.xlpos[0], 0, self.xlabel[0], **opts)
-        if self.xlabel[1]:
-            self.axes.text(0, -self.xlpos[1], 0, self.xlabel[1], **opts)
-        if self.ylabel[0]:
-            self.axes.text(self.ylpos[0], 0, 0, self.ylabel[0], **opts)
-        if self.ylabel[1]:
-            self.axes.text(self.ylpos[1], 0, 0, self.ylabel[1], **opts)
-        if self.zlabel[0]:
-            self.axes.text(0, 0, self.zlpos[0], self.zlabel[0], **opts)
-        if self.zlabel[1]:
-            self.axes.text(0, 0, self.zlpos[1], self.zlabel[1], **opts)
-
-        for a in (self.axes.xaxis.get_ticklines() +
-                  self.axes.xaxis.get_ticklabels()):
-            a.set_visible(False)
-        for a in (self.axes.yaxis.get_ticklines() +
-                  self.axes.yaxis.get_ticklabels()):
-            a.set_visible(False)
-        for a in (self.axes.zaxis.get_ticklines() +
-                  self.axes.zaxis.get_ticklabels()):
-            a.set_visible(False)
-
-    def plot_vectors(self):
-        """Plot Bloch vectors."""
-        for k, vec in enumerate(self.vectors):
-            # Apply a small uniform extension to ensure vectors reach surface
-            vec_extended = vec * 1.02
-            xs3d = np.array([0, vec_extended[1]])
-            ys3d = np.array([0, -vec_extended[0]])
-            zs3d = np.array([0, vec_extended[2]])
-
-            alpha = self.vector_alpha[k]
-            color = self.vector_color[k]
+        # +x, -x, +y, -y, +z, -z labels and where they sit, in plot coordinates
+        labels = (
+            ((0, -self.xlpos[0], 0), self.xlabel[0]),
+            ((0, -self.xlpos[1], 0), self.xlabel[1]),
+            ((self.ylpos[0], 0, 0), self.ylabel[0]),
+            ((self.ylpos[1], 0, 0), self.ylabel[1]),
+            ((0, 0, self.zlpos[0]), self.zlabel[0]),
+            ((0, 0, self.zlpos[1]), self.zlabel[1]),
+        )
+        for (x, y, z), label in labels:
+            if label:  # Only show if not empty
+                self.axes.text(x, y, z, label, **opts)
+
+        # axes.clear() makes new tick artists, so they are hidden on every render
+        for axis in (self.axes.xaxis, self.axes.yaxis, self.axes.zaxis):
+            for a in axis.get_ticklines() + axis.get_ticklabels():
+                a.set_visible(False)
+
+    def plot_vectors(self, start=0):
+        """Plot Bloch vectors, from index ``start`` on."""
+        if len(self.vectors) <= start:
+            return
+        
+        # Arrows run from the origin to each vector, in plot coordinates
+        # (y, -x, z), with a small uniform extension to reach the surface
+        vecs = np.asarray(self.vectors[start:], dtype=float) * 1.02
+        endpoints = np.zeros((len(vecs), 2, 3))
+        endpoints[:, 1, 0] = vecs[:, 1]
+        endpoints[:, 1, 1] = -vecs[:, 0]
+        endpoints[:, 1, 2] = vecs[:, 2]
+        
+        # All arrows share one projection per draw, and one arrow style
+        # resolved from its string once instead of once per arrow
+        group = _Arrow3DGroup(endpoints)
+        style = self.vector_style
+        if isinstance(style, str):
+            style = ArrowStyle(style)
+        arrow_kwargs = dict(mutation_scale=self.vector_mutation,
+                            lw=self.vector_width, arrowstyle=style,
+                            shrinkA=0, shrinkB=5)  # Small shrink at head only
+        for k, (alpha, color) in enumerate(zip(self.vector_alpha[start:], self.vector_color[start:])):
             if color is None:
-                idx = k % len(self.vector_default_color)
+                idx = (start + k) % len(self.vector_default_color)
                 color = self.vector_default_color[idx]
 
-            a = Arrow3D(xs3d, ys3d, zs3d,
-                        mutation_scale=self.vector_mutation,
-                        lw=self.vector_width,
-                        arrowstyle=self.vector_style,
-                        color=color, alpha=alpha,
-                        shrinkA=0, shrinkB=5)  # Small shrink at head only
+            a = GroupedArrow3D(group, k, color=color, alpha=alpha, **arrow_kwargs)
             self.axes.add_artist(a)
 
     def plot_points(self):
@@ -840,16 +1152,19 @@ class Bloch:
         for k, points in enumerate(self.points):
             points = np.asarray(points)
             num_points = points.shape[1]
+            style = self.point_style[k]
 
-            dist = np.linalg.norm(points, axis=0)
-            if not np.allclose(dist, dist[0], rtol=1e-12):
-                indperm = np.argsort(dist)
-            else:
-                indperm = np.arange(num_points)
+            # Markers are drawn in order of distance from the origin; lines
+            # keep their order. The squared radii sort the same as the radii.
+            indperm = None
+            if style in ['s', 'm']:
+                d2 = np.einsum('ij,ij->j', points, points.conj()).real
+                dist = np.sqrt(d2)
+                if np.ptp(dist) > 1e-8 + 1e-12 * dist.max():
+                    indperm = np.argsort(d2, kind='stable')
 
             s = self.point_size[np.mod(k, len(self.point_size))]
             marker = self.point_marker[np.mod(k, len(self.point_marker))]
-            style = self.point_style[k]
 
             if self._inner_point_color[k] is not None:
                 color = self._inner_point_color[k]
@@ -858,15 +1173,19 @@ class Bloch:
             elif style in ['s', 'l']:
                 color = [self.point_default_color[k % len(self.point_default_color)]]
             elif style == 'm':
-                length = np.ceil(num_points/len(self.point_default_color))
-                color = np.tile(self.point_default_color, length.astype(int))
-                color = color[indperm]
-                color = list(color)
+                # Cycle the palette as one (n, 4) RGBA array, so scatter
+                # takes the colors as they are instead of parsing n strings
+                palette = matplotlib.colors.to_rgba_array(self.point_default_color)
+                idx = np.arange(num_points) % len(palette)
+                color = palette[idx if indperm is None else idx[indperm]]
 
             if style in ['s', 'm']:
-                self.axes.scatter(np.real(points[1][indperm]),
-                                  -np.real(points[0][indperm]),
-                                  np.real(points[2][indperm]),
+                # One contiguous (3, n) block in plot coordinates (y, -x, z),
+                # gathered in depth order by a single indexing step
+                xyz = np.real(points)
+                xyz = xyz[[1, 0, 2]] if indperm is None else xyz[np.ix_((1, 0, 2), indperm)]
+                np.negative(xyz[1], out=xyz[1])
+                self.axes.scatter(xyz[0], xyz[1], xyz[2],
                                   s=s, marker=marker, color=color,
                                   alpha=self.point_alpha[k],
                                   edgecolor=None, zdir='z')
@@ -935,7 +1254,8 @@ class Bloch:
         else:
             self.fig.show()
 
-    def save(self, name=None, format='png', dirc=None, dpin=None):
+    def save(self, name=None, format='png', dirc=None, dpin=None,
+             pil_kwargs=None, close=True):
         """Save Bloch sphere to file.
 
         Parameters
@@ -948,28 +1268,33 @@ class Bloch:
             Output directory.
         dpin : int
             Resolution in DPI.
+        pil_kwargs : dict, optional
+            Extra options for the Pillow image writer, e.g.
+            ``{'compress_level': 1}`` for faster PNG encoding.
+        close : bool, default=True
+            Close the figure after saving. Pass ``False`` when saving several
+            images in a row, so later saves reuse the figure and axes instead
+            of building new ones.
         """
         self.render()
         
+        out_dir = os.getcwd()
         if dirc:
-            if not os.path.isdir(os.getcwd() + "/" + str(dirc)):
-                os.makedirs(os.getcwd() + "/" + str(dirc))
+            out_dir = os.path.join(out_dir, str(dirc))
+            os.makedirs(out_dir, exist_ok=True)
                 
         if name is None:
-            if dirc:
-                complete_path = os.getcwd() + "/" + str(dirc) + '/bloch_' \
-                                + str(self.savenum) + '.' + format
-            else:
-                complete_path = os.getcwd() + '/bloch_' + \
-                                str(self.savenum) + '.' + format
+            complete_path = os.path.join(out_dir, f'bloch_{self.savenum}.{format}')
         else:
             complete_path = name
 
+        savefig_kwargs = {}
         if dpin:
-            self.fig.savefig(complete_path, dpi=dpin)
-        else:
-            self.fig.savefig(complete_path)
+            savefig_kwargs['dpi'] = dpin
+        if pil_kwargs is not None:
+            savefig_kwargs['pil_kwargs'] = pil_kwargs
+        self.fig.savefig(complete_path, **savefig_kwargs)
             
         self.savenum += 1
-        if self.fig:
+        if close and self.fig:
             plt.close(self.fig)
\ No newline at end of file
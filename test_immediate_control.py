@@ -3,8 +3,10 @@
 
 from qsip import print_tex
 
-# Test teleportation
-teleport = """
+
+def main():
+    # Test teleportation
+    teleport = """
 OPENQASM 3.0;
 include "stdgates.inc";
 
@@ -26,19 +28,19 @@ if (c[1]) x q[2];
 if (c[0]) z q[2];
 """
 
-print("Quantum Teleportation (default spacing):")
-print(print_tex(teleport, latex=True))
+    print("Quantum Teleportation (default spacing):")
+    print(print_tex(teleport, latex=True))
 
-print("\n\nQuantum Teleportation (with custom spacing):")
-print(print_tex(teleport, latex=True, options={"height": "3mm", "width": "5mm"}))
+    print("\n\nQuantum Teleportation (with custom spacing):")
+    print(print_tex(teleport, latex=True, options={"height": "3mm", "width": "5mm"}))
 
-# Test filename extraction
-print("\n\nTesting auto filename extraction:")
-print_tex(teleport, save_fig=True)
-print("Should have saved as 'teleport.pdf'")
+    # Test filename extraction
+    print("\n\nTesting auto filename extraction:")
+    print_tex(teleport, save_fig=True)
+    print("Should have saved as 'teleport.pdf'")
 
-# Let's also test with a simpler circuit
-simple_test = """
+    # Let's also test with a simpler circuit
+    simple_test = """
 OPENQASM 3.0;
 include "stdgates.inc";
 
@@ -50,9 +52,13 @@ c = measure q[0];
 if (c) x q[1];
 """
 
-print("\n\nSimple Test (H, measure, controlled X):")
-print(print_tex(simple_test, latex=True))
+    print("\n\nSimple Test (H, measure, controlled X):")
+    print(print_tex(simple_test, latex=True))
+
+    # Test with explicit filename
+    print_tex(simple_test, save_fig=True, filename="my_simple_circuit.pdf")
+    print("Should have saved as 'my_simple_circuit.pdf'")
+
 
-# Test with explicit filename
-print_tex(simple_test, save_fig=True, filename="my_simple_circuit.pdf")
-print("Should have saved as 'my_simple_circuit.pdf'")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
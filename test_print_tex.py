@@ -3,7 +3,43 @@
 
 import os
 import tempfile
-from qsip import print_tex
+from contextlib import contextmanager
+from unittest import mock
+
+from qsip import print_tex, print_tex_many, print_tex_batch
+from qsip.translators import openqasm_to_quantikz as qtz
+
+
+@contextmanager
+def _stub_pdflatex():
+    """Run in a temp cwd and HOME with a fake pdflatex.
+    
+    The fake "compile" copies the .tex source to the .pdf path, so a saved
+    file holds the document it was built from. Yields the list of compile
+    commands, which stays empty on PDF cache hits.
+    """
+    calls = []
+    
+    def fake_run(cmd, cwd):
+        calls.append(cmd)
+        tex_file = cmd[-1]
+        with open(tex_file) as src, open(tex_file[:-4] + ".pdf", "w") as dst:
+            dst.write(src.read())
+        return 0
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        old_cwd = os.getcwd()
+        os.chdir(tmpdir)
+        env = {key: value for key, value in os.environ.items() if key != "XDG_CACHE_HOME"}
+        env["HOME"] = tmpdir
+        try:
+            with mock.patch.dict(os.environ, env, clear=True), \
+                    mock.patch.object(qtz, "_run_quiet", fake_run), \
+                    mock.patch.object(qtz, "_preamble_format", lambda border: None):
+                yield calls
+        finally:
+            os.chdir(old_cwd)
+
 
 def test_basic_functionality():
     """Test basic circuit translation."""
@@ -374,6 +410,136 @@ ccx q[0], q[1], q[2];
     print()
 
 
+def test_batch_translation():
+    """Test translating several circuits at once."""
+    print("Test 13: Batch Translation")
+    
+    bell = """
+OPENQASM 3.0;
+include "stdgates.inc";
+qubit[2] q;
+h q[0];
+cx q[0], q[1];
+"""
+    single = """
+OPENQASM 3.0;
+include "stdgates.inc";
+qubit q;
+x q;
+"""
+    
+    codes = print_tex_many([bell, single], latex=True, options={"width": "4mm"})
+    
+    # Each circuit matches its individual translation
+    assert codes == [print_tex(bell, latex=True, options={"width": "4mm"}),
+                     print_tex(single, latex=True, options={"width": "4mm"})]
+    print("✓ Batch translation matches print_tex\n")
+
+
+def test_batch_files():
+    """Test that print_tex_batch writes what print_tex would."""
+    print("Test 14: Batch Files")
+    
+    bell = """
+OPENQASM 3.0;
+include "stdgates.inc";
+qubit[2] q;
+h q[0];
+cx q[0], q[1];
+"""
+    single = """
+OPENQASM 3.0;
+include "stdgates.inc";
+qubit q;
+x q;
+"""
+    
+    with _stub_pdflatex():
+        written = print_tex_batch([bell, single], filenames=["bell.pdf", "single.pdf"])
+        assert written == ["bell.pdf", "single.pdf"]
+        print_tex(bell, save_fig=True, show=False, filename="bell_single.pdf")
+        print_tex(single, save_fig=True, show=False, filename="single_single.pdf")
+        
+        for batch_file, single_file in [("bell.pdf", "bell_single.pdf"),
+                                        ("single.pdf", "single_single.pdf")]:
+            with open(batch_file) as a, open(single_file) as b:
+                assert a.read() == b.read()
+        
+        try:
+            print_tex_batch([bell, single], filenames=["only.pdf"])
+            assert False, "mismatched filenames should raise"
+        except ValueError:
+            pass
+    print("✓ Batch files match individual print_tex output\n")
+
+
+def test_name_argument():
+    """Test that name= sets the saved file name."""
+    print("Test 15: Name Argument")
+    
+    circuit = """
+OPENQASM 3.0;
+include "stdgates.inc";
+qubit q;
+h q;
+"""
+    
+    with _stub_pdflatex():
+        print_tex(circuit, save_fig=True, show=False, name="my_circuit")
+        assert os.path.exists("my_circuit.pdf")
+        assert not os.path.exists("circuit.pdf")
+        
+        # An explicit filename still wins
+        print_tex(circuit, save_fig=True, show=False, name="ignored", filename="explicit.pdf")
+        assert os.path.exists("explicit.pdf")
+        assert not os.path.exists("ignored.pdf")
+    print("✓ name= is honored\n")
+
+
+def test_pdf_cache():
+    """Test the on-disk PDF cache: hits, border keys and eviction."""
+    print("Test 16: PDF Cache")
+    
+    circuit = """
+OPENQASM 3.0;
+include "stdgates.inc";
+qubit q;
+%s q;
+"""
+    
+    with _stub_pdflatex() as calls:
+        cache_dir = os.path.join(os.environ["HOME"], ".cache", "qsip", "pdf")
+        
+        # The second save of the same circuit is served from the cache
+        print_tex(circuit % "h", save_fig=True, show=False, filename="first.pdf")
+        assert len(calls) == 1
+        assert len(os.listdir(cache_dir)) == 1
+        print_tex(circuit % "h", save_fig=True, show=False, filename="again.pdf")
+        assert len(calls) == 1
+        with open("first.pdf") as a, open("again.pdf") as b:
+            assert a.read() == b.read()
+        
+        # The border is part of the document, hence of the key
+        code = [print_tex(circuit % "h", latex=True)]
+        assert (qtz._pdf_cache_path(qtz._LATEX_HEADER % "2pt", code)
+                != qtz._pdf_cache_path(qtz._LATEX_HEADER % "5pt", code))
+        print_tex(circuit % "h", save_fig=True, show=False, filename="wide.pdf", border="5pt")
+        assert len(calls) == 2
+        assert len(os.listdir(cache_dir)) == 2
+        
+        # Beyond the size limit, the least recently used entries go first
+        for i, entry in enumerate(sorted(os.scandir(cache_dir), key=lambda e: e.name)):
+            os.utime(entry.path, (i + 1, i + 1))
+        oldest = min(os.scandir(cache_dir), key=lambda e: e.stat().st_mtime).path
+        with mock.patch.object(qtz, "_PDF_CACHE_MAX", 2):
+            print_tex(circuit % "x", save_fig=True, show=False, filename="x.pdf")
+        assert len(calls) == 3
+        remaining = [e.path for e in os.scandir(cache_dir)]
+        assert len(remaining) == 2
+        assert oldest not in remaining
+    print("✓ PDF cache hits, keys by border and evicts by age\n")
+
+
 if __name__ == "__main__":
     print("Running comprehensive tests for print_tex function\n")
     print("=" * 60)
@@ -390,6 +556,10 @@ if __name__ == "__main__":
     test_error_handling()
     test_backward_compatibility()
     test_all_gates()
+    test_batch_translation()
+    test_batch_files()
+    test_name_argument()
+    test_pdf_cache()
     
     print("=" * 60)
     print("All tests completed!")
\ No newline at end of file